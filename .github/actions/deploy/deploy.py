@@ -16,7 +16,7 @@ import tempfile
 import time
 import yaml
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 from urllib.parse import quote_plus
 
 
@@ -60,8 +60,12 @@ class MLflowDeployer:
                     description=None,
                     check=True,
                     capture_output=False,
-                    timeout: int = 300) -> subprocess.CompletedProcess:
-        """Run shell command with streaming output to avoid memory issues."""
+                    timeout: int = 300,
+                    input: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run shell command with streaming output to avoid memory issues.
+
+        ``input``, when given, is written to the command's stdin.
+        """
         if description:
             print(f"📋 {description}")
 
@@ -88,13 +92,14 @@ class MLflowDeployer:
                 cmd_args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Merge stderr into stdout
+                stdin=subprocess.PIPE if input is not None else None,
                 text=True,
                 bufsize=1,  # Line buffered
                 universal_newlines=True,
                 shell=shell)
 
             # Use communicate with timeout to enforce timeout properly
-            stdout, stderr = process.communicate(timeout=timeout)
+            stdout, stderr = process.communicate(input=input, timeout=timeout)
             return_code = process.returncode
 
             # Split into lines for compatibility
@@ -880,16 +885,13 @@ class MLflowDeployer:
         if self._tls_ca_bundle_cm:
             mlflow_cr["spec"]["caBundleConfigMap"] = {"name": self._tls_ca_bundle_cm}
 
-        # Write CR to file
-        cr_file = Path("/tmp/mlflow-cr.yaml")
-        with open(cr_file, 'w') as f:
-            yaml.dump(mlflow_cr, f, default_flow_style=False)
+        cr_yaml = yaml.dump(mlflow_cr, default_flow_style=False)
 
         print("Generated MLflow CR:")
-        print(yaml.dump(mlflow_cr, default_flow_style=False))
+        print(cr_yaml)
 
-        # Apply the CR
-        self.run_command(f"kubectl apply -f {cr_file}", "Creating MLflow CR")
+        # Apply the CR from stdin rather than round-tripping through a temp file
+        self.run_command(["kubectl", "apply", "-f", "-"], "Creating MLflow CR", input=cr_yaml)
 
         # Wait for MLflow deployment to be created first
         try:
@@ -39,9 +39,13 @@ class ResourceType(Enum):
             List of sub-resource names (e.g., 'gatewaysecrets/use')
             Empty list if no sub-resources exist for this resource type.
         """
-        sub_resource_mapping = {
-            ResourceType.GATEWAY_SECRETS: ["gatewaysecrets/use"],
-            ResourceType.GATEWAY_ENDPOINTS: ["gatewayendpoints/use"],
-            ResourceType.GATEWAY_MODEL_DEFINITIONS: ["gatewaymodeldefinitions/use"],
-        }
-        return sub_resource_mapping.get(self, [])
\ No newline at end of file
+        # Copy so callers may mutate the result without touching the shared table
+        return list(_SUB_RESOURCES.get(self, ()))
+
+
+# Built once at import time; the mapping is constant for the life of the process.
+_SUB_RESOURCES: dict[ResourceType, tuple[str, ...]] = {
+    ResourceType.GATEWAY_SECRETS: ("gatewaysecrets/use",),
+    ResourceType.GATEWAY_ENDPOINTS: ("gatewayendpoints/use",),
+    ResourceType.GATEWAY_MODEL_DEFINITIONS: ("gatewaymodeldefinitions/use",),
+}
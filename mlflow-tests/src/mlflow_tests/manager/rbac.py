@@ -1,18 +1,158 @@
 """Kubernetes RBAC management."""
 
+import functools
+import itertools
 import logging
+import random
+import threading
 import time
+from typing import Any
+
 from kubernetes import client
+from kubernetes.client import V1ResourceAttributes, V1SubjectAccessReview, V1SubjectAccessReviewSpec
 from kubernetes.client.rest import ApiException
 
 from mlflow_tests.enums import KubeVerb, ResourceType
 
 logger = logging.getLogger(__name__)
 
+# API group serving the MLflow custom resources
+_MLFLOW_API_GROUP = "mlflow.kubeflow.org"
+
+# Backoff growth per verification retry and the ceiling on any single delay
+_RETRY_BACKOFF_MULTIPLIER = 1.2
+_MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Server-side apply settings for the Roles and RoleBindings owned by the test framework
+_FIELD_MANAGER = "mlflow-tests"
+_APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+
+# Core Kubernetes API permissions every test user gets. These are needed for MLflow
+# to authenticate with the K8s API and validate tokens; users that may create
+# resources also get ``create``. Rules are kept in wire format (see _build_policy_rules).
+_CORE_RULE_RO = {
+    "apiGroups": [""],  # Core API group
+    "resources": ["namespaces", "serviceaccounts", "secrets"],
+    "verbs": ["get", "list"],
+}
+_CORE_RULE_RW = {
+    "apiGroups": [""],  # Core API group
+    "resources": ["namespaces", "serviceaccounts", "secrets"],
+    "verbs": ["get", "list", "create"],
+}
+
+# Read access to the user's own roles and bindings (for token validation)
+_RBAC_RULE = {
+    "apiGroups": ["rbac.authorization.k8s.io"],
+    "resources": ["roles", "rolebindings"],
+    "verbs": ["get", "list"],
+}
+
+
+def _sleep_with_jitter(delay: float) -> float:
+    """Sleep for a randomized interval around ``delay`` and return the next delay.
+
+    Jitter keeps concurrent verifications from retrying against the API server
+    in lockstep while preserving the average wait of the un-jittered schedule.
+
+    Args:
+        delay: Nominal delay in seconds for this attempt
+
+    Returns:
+        Nominal delay for the next attempt, capped at _MAX_RETRY_DELAY_SECONDS
+    """
+    time.sleep(random.uniform(0.5 * delay, 1.5 * delay))
+    return min(delay * _RETRY_BACKOFF_MULTIPLIER, _MAX_RETRY_DELAY_SECONDS)
+
+
+@functools.lru_cache(maxsize=64)
+def _gateway_sub_resources(resources: tuple[ResourceType, ...]) -> tuple[str, ...]:
+    """Collect the gateway sub-resources implied by a set of resource types.
+
+    Args:
+        resources: MLflow resource types granted on a Role
+
+    Returns:
+        Sub-resources (e.g. ``gatewaysecrets/use``) in resource order
+    """
+    return tuple(itertools.chain.from_iterable(resource.get_k8s_sub_resources() for resource in resources))
+
+
+@functools.lru_cache(maxsize=64)
+def _build_policy_rules(
+    main_verbs: tuple[str, ...],
+    unscoped_resources: tuple[str, ...],
+    scoped_resources: tuple[tuple[str, tuple[str, ...]], ...],
+    sub_resources: tuple[str, ...],
+    grant_create: bool,
+) -> tuple[dict[str, Any], ...]:
+    """Build the policy rules for a test user's Role.
+
+    Most users in a run share the same rule shape, so results are memoized. Rules
+    are returned already in wire format, so the client does not reflect over
+    OpenAPI models each time a Role is applied. They are only read during
+    serialization, which makes sharing them between Roles safe.
+
+    Args:
+        main_verbs: Verbs granted on the MLflow main resources
+        unscoped_resources: MLflow resources granted without a name restriction
+        scoped_resources: (resource, allowed names) pairs for name-scoped grants
+        sub_resources: MLflow sub-resources to grant ``create`` on
+        grant_create: Whether ``create`` is among the granted verbs
+
+    Returns:
+        Tuple of serialized policy rules in the order they appear on the Role
+    """
+    policy_rules = []
+
+    # Rule 1: MLflow main resources (experiments, registeredmodels, jobs, etc.)
+    for resource, scoped_names in scoped_resources:
+        policy_rules.append(
+            {
+                "apiGroups": [_MLFLOW_API_GROUP],
+                "resources": [resource],
+                "verbs": list(main_verbs),
+                "resourceNames": list(scoped_names),
+            }
+        )
+
+    if unscoped_resources:
+        mlflow_main_rule = {
+            "apiGroups": [_MLFLOW_API_GROUP],
+            "resources": list(unscoped_resources),
+            "verbs": list(main_verbs),
+        }
+        policy_rules.append(mlflow_main_rule)
+
+    # Rule 2: MLflow sub-resources (gatewaysecrets/use, gatewayendpoints/use, etc.)
+    if sub_resources:
+        mlflow_sub_rule = {
+            "apiGroups": [_MLFLOW_API_GROUP],
+            "resources": list(sub_resources),
+            "verbs": ["create"],  # Sub-resources only support create verb in K8s
+        }
+        policy_rules.append(mlflow_sub_rule)
+
+    # Rule 3: Core Kubernetes API permissions for basic authentication and namespace access
+    core_rule = _CORE_RULE_RW if grant_create else _CORE_RULE_RO
+    policy_rules.append(core_rule)
+
+    # Rule 4: RBAC permissions to read own roles and bindings (for token validation)
+    policy_rules.append(_RBAC_RULE)
+
+    return tuple(policy_rules)
+
 
 class K8RoleManager:
     """Class for managing Kubernetes Roles and RoleBindings."""
 
+    # How long a granted SubjectAccessReview is trusted before it is re-checked
+    SAR_CACHE_TTL_SECONDS = 60.0
+
+    # How long verification fails fast after the SubjectAccessReview API itself kept
+    # erroring, roughly one verification retry budget
+    SAR_CIRCUIT_OPEN_SECONDS = 30.0
+
     def __init__(self, rbac_v1_api: client.RbacAuthorizationV1Api):
         """Initialize the K8RoleManager with a Kubernetes RBAC API client.
 
@@ -20,6 +160,18 @@ class K8RoleManager:
             rbac_v1_api: Kubernetes RBAC API client
         """
         self.rbac_v1_api = rbac_v1_api
+        # Share the RBAC client's connection pool rather than building a new ApiClient per check
+        self.auth_api = client.AuthorizationV1Api(rbac_v1_api.api_client)
+        # (service_account, namespace, verb, resource, resource_name) -> expiry (monotonic)
+        self._sar_cache: dict[tuple[str, str, str, str, str | None], float] = {}
+        self._sar_cache_lock = threading.Lock()
+        # SubjectAccessReview circuit breaker for this manager's API client. It is closed
+        # while _sar_circuit_open_until is 0.0; once the open window passes, one probe
+        # call is let through to decide whether to close it again.
+        self._sar_circuit_open_until = 0.0
+        self._sar_circuit_reason = ""
+        self._sar_circuit_probing = False
+        self._sar_circuit_lock = threading.Lock()
 
     def create_role(
             self,
@@ -41,122 +193,85 @@ class K8RoleManager:
             resource_names: Optional mapping of resource type to allowed names
 
         Raises:
-            ApiException: If creation fails
+            ApiException: If the apply fails
         """
-        main_verbs = [verb.value for verb in verbs]
+        main_verbs = tuple(verb.value for verb in verbs)
+        grant_create = KubeVerb.CREATE in verbs
         subresources = subresources or []
         resource_names = resource_names or {}
 
         # Get K8s resource names from ResourceType
         k8s_resources = [r.get_k8s_resource() for r in resources]
 
-        # Create policy rules
-        policy_rules = []
-
-        # Rule 1: MLflow main resources (experiments, registeredmodels, jobs, etc.)
-        unscoped_resources = []
-        for resource in resources:
-            scoped_names = resource_names.get(resource, [])
-            if not scoped_names:
-                unscoped_resources.append(resource.get_k8s_resource())
-                continue
-
-            policy_rules.append(
-                client.V1PolicyRule(
-                    api_groups=["mlflow.kubeflow.org"],
-                    resources=[resource.get_k8s_resource()],
-                    verbs=main_verbs,
-                    resource_names=scoped_names,
-                )
-            )
-            logger.debug(
-                "Added name-scoped resource rule: resource=%s, verbs=%s, names=%s",
-                resource.get_k8s_resource(),
-                main_verbs,
-                scoped_names,
-            )
-
-        if unscoped_resources:
-            mlflow_main_rule = client.V1PolicyRule(
-                api_groups=["mlflow.kubeflow.org"],
-                resources=unscoped_resources,
-                verbs=main_verbs,
-            )
-            policy_rules.append(mlflow_main_rule)
-            logger.debug(
-                "Added main resource rule: resources=%s, verbs=%s",
-                unscoped_resources,
-                main_verbs,
-            )
+        # Rule 1 inputs: MLflow main resources, split by whether they are name-scoped
+        unscoped_resources = tuple(
+            resource.get_k8s_resource() for resource in resources if not resource_names.get(resource)
+        )
+        scoped_resources = tuple(
+            (resource.get_k8s_resource(), tuple(resource_names[resource]))
+            for resource in resources
+            if resource_names.get(resource)
+        )
 
-        # Rule 2: MLflow sub-resources (gatewaysecrets/use, gatewayendpoints/use, etc.)
-        # Only add if subresources are explicitly provided
-        gateway_sub_resources: list[str] = []
+        # Rule 2 inputs: MLflow sub-resources (gatewaysecrets/use, gatewayendpoints/use, etc.).
+        # Explicit subresources win; otherwise gateway sub-resources are auto-detected
+        # from the resource types and only granted alongside create.
+        gateway_sub_resources = _gateway_sub_resources(tuple(resources))
         if subresources:
-            # Use provided subresources directly
-            mlflow_sub_rule = client.V1PolicyRule(
-                api_groups=["mlflow.kubeflow.org"],
-                resources=subresources,
-                verbs=["create"],  # Sub-resources only support create verb in K8s
-            )
-            policy_rules.append(mlflow_sub_rule)
-            logger.debug(f"Added sub-resource rule: resources={subresources}, verbs=['create']")
+            rule_sub_resources = tuple(subresources)
+        elif grant_create:
+            rule_sub_resources = gateway_sub_resources
         else:
-            # Auto-detect gateway sub-resources from resource types if subresources not specified
-            for resource in resources:
-                gateway_sub_resources.extend(resource.get_k8s_sub_resources())
-
-            if gateway_sub_resources and KubeVerb.CREATE in verbs:
-                mlflow_sub_rule = client.V1PolicyRule(
-                    api_groups=["mlflow.kubeflow.org"],
-                    resources=gateway_sub_resources,
-                    verbs=["create"],
-                )
-                policy_rules.append(mlflow_sub_rule)
-                logger.debug(f"Added auto-detected sub-resource rule: resources={gateway_sub_resources}, verbs=['create']")
-
-        # Rule 3: Core Kubernetes API permissions for basic authentication and namespace access
-        # These are needed for MLflow to authenticate with the K8s API and validate tokens
-        core_verbs = ["get", "list"] if KubeVerb.CREATE not in verbs else ["get", "list", "create"]
-        core_rule = client.V1PolicyRule(
-            api_groups=[""],  # Core API group
-            resources=["namespaces", "serviceaccounts", "secrets"],
-            verbs=core_verbs,
-        )
-        policy_rules.append(core_rule)
-        logger.debug(f"Added core API rule to provide access to namespace, sa and secrets: verbs={core_verbs}")
-
-        # Rule 4: RBAC permissions to read own roles and bindings (for token validation)
-        rbac_rule = client.V1PolicyRule(
-            api_groups=["rbac.authorization.k8s.io"],
-            resources=["roles", "rolebindings"],
-            verbs=["get", "list"],
-        )
-        policy_rules.append(rbac_rule)
-        logger.debug(f"Added RBAC read rule")
+            rule_sub_resources = ()
 
-        # Create role with all policy rules
-        k8s_role = client.V1Role(
-            metadata=client.V1ObjectMeta(name=name, namespace=namespace),
-            rules=policy_rules,
+        policy_rules = list(
+            _build_policy_rules(
+                main_verbs,
+                unscoped_resources,
+                scoped_resources,
+                rule_sub_resources,
+                grant_create,
+            )
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            for rule in policy_rules:
+                logger.debug(
+                    "Role '%s' rule: resources=%s, verbs=%s, names=%s",
+                    name,
+                    rule["resources"],
+                    rule["verbs"],
+                    rule.get("resourceNames"),
+                )
+
+        # Apply role with all policy rules. Server-side apply is an idempotent
+        # upsert, so re-running setup for an existing user needs no 409 handling.
+        k8s_role = {
+            "apiVersion": "rbac.authorization.k8s.io/v1",
+            "kind": "Role",
+            "metadata": {"name": name, "namespace": namespace},
+            "rules": policy_rules,
+        }
 
         try:
-            self.rbac_v1_api.create_namespaced_role(namespace=namespace, body=k8s_role)
-            logger.info(f"Created role '{name}' in namespace '{namespace}' with {len(policy_rules)} policy rules")
+            self.rbac_v1_api.patch_namespaced_role(
+                name=name,
+                namespace=namespace,
+                body=k8s_role,
+                field_manager=_FIELD_MANAGER,
+                force=True,
+                _content_type=_APPLY_PATCH_CONTENT_TYPE,
+            )
+            logger.info(f"Applied role '{name}' in namespace '{namespace}' with {len(policy_rules)} policy rules")
             logger.info(
                 "Role '%s' permissions: main_resources=%s, scoped_resources=%s, sub_resources=%s",
                 name,
                 k8s_resources,
                 {resource.value: names for resource, names in resource_names.items()},
-                gateway_sub_resources,
+                rule_sub_resources,
             )
         except ApiException as e:
-            if e.status == 409:  # Resource already exists - ignore
-                logger.debug(f"Role '{name}' already exists, continuing")
-            else:
-                logger.error(f"Failed to create role '{name}': {e}")
-                raise
+            logger.error(f"Failed to apply role '{name}': {e}")
+            raise
 
     def create_role_binding(
             self,
@@ -174,33 +289,26 @@ class K8RoleManager:
             service_account_name: ServiceAccount to bind the role to
 
         Raises:
-            ApiException: If creation fails
+            ApiException: If the apply fails
         """
-        # Create role reference
-        role_ref = client.V1RoleRef(
-            api_group="rbac.authorization.k8s.io", kind="Role", name=role_name
-        )
-
-        # Create subject for service account
-        subject = client.RbacV1Subject(
-            kind="ServiceAccount", name=service_account_name, namespace=namespace
+        # Apply role binding, built directly in wire format
+        role_binding = {
+            "apiVersion": "rbac.authorization.k8s.io/v1",
+            "kind": "RoleBinding",
+            "metadata": {"name": name, "namespace": namespace},
+            "roleRef": {"apiGroup": "rbac.authorization.k8s.io", "kind": "Role", "name": role_name},
+            "subjects": [{"kind": "ServiceAccount", "name": service_account_name, "namespace": namespace}],
+        }
+
+        self.rbac_v1_api.patch_namespaced_role_binding(
+            name=name,
+            namespace=namespace,
+            body=role_binding,
+            field_manager=_FIELD_MANAGER,
+            force=True,
+            _content_type=_APPLY_PATCH_CONTENT_TYPE,
         )
-
-        # Create role binding
-        role_binding = client.V1RoleBinding(
-            metadata=client.V1ObjectMeta(name=name, namespace=namespace),
-            role_ref=role_ref,
-            subjects=[subject],
-        )
-
-        try:
-            self.rbac_v1_api.create_namespaced_role_binding(
-                namespace=namespace, body=role_binding
-            )
-            logger.info(f"Created role binding '{name}' in namespace '{namespace}' for MLflow SSAR validation")
-        except ApiException as e:
-            if e.status != 409:  # Ignore if already exists
-                raise
+        logger.info(f"Applied role binding '{name}' in namespace '{namespace}' for MLflow SSAR validation")
 
     def verify_rbac_permissions(
         self,
@@ -221,62 +329,137 @@ class K8RoleManager:
             verb: K8s verb to check (e.g. 'delete')
             resource_name: Optional name for name-scoped authorization checks
             max_retries: Maximum number of verification attempts
-            retry_delay: Delay between attempts (exponential backoff)
+            retry_delay: Initial delay between attempts (jittered exponential backoff)
 
         Raises:
             Exception: If permissions are not available after max_retries
+
+        Note:
+            Only granted reviews are cached (for SAR_CACHE_TTL_SECONDS). Denials are
+            never cached because they are usually RBAC propagation lag that the retry
+            loop is waiting out.
+
+            If every attempt errors (rather than being denied), the review API is treated
+            as broken and later calls on this manager fail fast for SAR_CIRCUIT_OPEN_SECONDS
+            instead of waiting out the full retry schedule again. After that, a single call
+            probes the API with one attempt: a response closes the circuit, an error
+            reopens it.
         """
-        from kubernetes.client import AuthorizationV1Api, V1SubjectAccessReview, V1SubjectAccessReviewSpec, V1ResourceAttributes
-
-        auth_api = AuthorizationV1Api()
-
-        # Try multiple API groups that MLflow might use
-        api_groups_to_try = [
-            "mlflow.kubeflow.org",
-        ]
-
-        for api_group in api_groups_to_try:
-            logger.debug(f"Trying RBAC verification for {service_account_name} with API group '{api_group}' for {verb} {resource}")
-            sar_resource_name = resource_name if resource_name else None
-            current_delay = retry_delay
-
-            # Create SubjectAccessReview to verify permissions
-            sar = V1SubjectAccessReview(
-                spec=V1SubjectAccessReviewSpec(
-                    resource_attributes=V1ResourceAttributes(
-                        namespace=namespace,
-                        verb=verb,
-                        resource=resource,
-                        group=api_group,
-                        name=sar_resource_name,
-                    ),
-                    user=f"system:serviceaccount:{namespace}:{service_account_name}"
+        cache_key = (service_account_name, namespace, verb, resource, resource_name)
+        with self._sar_cache_lock:
+            expires_at = self._sar_cache.get(cache_key)
+        if expires_at is not None and time.monotonic() < expires_at:
+            logger.debug(
+                "RBAC permissions for %s to %s %s already verified, using cached result",
+                service_account_name,
+                verb,
+                resource,
+            )
+            return
+
+        with self._sar_circuit_lock:
+            probe = bool(self._sar_circuit_open_until)
+            if probe and (time.monotonic() < self._sar_circuit_open_until or self._sar_circuit_probing):
+                raise RuntimeError(
+                    f"RBAC permissions could not be verified for {service_account_name} to {verb} {resource}, "
+                    f"SubjectAccessReview API is unavailable: {self._sar_circuit_reason}"
                 )
+            if probe:
+                self._sar_circuit_probing = True
+
+        # MLflow resources are served from a single API group, so there is no group
+        # fan-out: every attempt goes to _MLFLOW_API_GROUP.
+        sar = V1SubjectAccessReview(
+            spec=V1SubjectAccessReviewSpec(
+                resource_attributes=V1ResourceAttributes(
+                    namespace=namespace,
+                    verb=verb,
+                    resource=resource,
+                    group=_MLFLOW_API_GROUP,
+                    name=resource_name if resource_name else None,
+                ),
+                user=f"system:serviceaccount:{namespace}:{service_account_name}"
             )
-            reason = "No reason provided"
-
-            for attempt in range(max_retries):
-                try:
-                    result = auth_api.create_subject_access_review(body=sar)
-                    if result.status.allowed:
-                        logger.info(f"RBAC permissions verified for {service_account_name} - can {verb} {resource} (API group: {api_group})")
-                        return
-                    else:
-                        if result.status.reason:
-                            reason = result.status.reason
-                        logger.debug(f"RBAC denied for API group '{api_group}' (attempt {attempt + 1}/{max_retries}): {reason}")
-                        if attempt < max_retries - 1:
-                            time.sleep(current_delay)
-                            current_delay *= 1.2  # Smaller backoff multiplier
-                except Exception as e:
-                    logger.debug(f"RBAC verification attempt {attempt + 1} failed for API group '{api_group}': {e}")
-                    if attempt < max_retries - 1:
-                        time.sleep(current_delay)
-                        current_delay *= 1.2
-                    else:
-                        break  # Try next API group
+        )
+        reason = "No reason provided"
+        api_responded = False
+        current_delay = retry_delay
+        logger.debug(
+            "Trying RBAC verification for %s with API group '%s' for %s %s",
+            service_account_name,
+            _MLFLOW_API_GROUP,
+            verb,
+            resource,
+        )
 
-        # If we get here, none of the API groups worked - log detailed error and continue
+        for attempt in range(max_retries):
+            try:
+                result = self.auth_api.create_subject_access_review(body=sar)
+                api_responded = True
+                if probe:
+                    self._close_sar_circuit()
+                    probe = False
+                if result.status.allowed:
+                    with self._sar_cache_lock:
+                        self._sar_cache[cache_key] = time.monotonic() + self.SAR_CACHE_TTL_SECONDS
+                    logger.info(f"RBAC permissions verified for {service_account_name} - can {verb} {resource} (API group: {_MLFLOW_API_GROUP})")
+                    return
+                else:
+                    if result.status.reason:
+                        reason = result.status.reason
+                    logger.debug(
+                        "RBAC denied (attempt %d/%d): %s",
+                        attempt + 1,
+                        max_retries,
+                        reason,
+                    )
+                    if result.status.denied:
+                        # An explicit deny is authoritative: unlike a plain "not allowed"
+                        # (typically RBAC propagation lag), retrying cannot change it.
+                        logger.debug("RBAC explicitly denied, not retrying")
+                        break
+                    if attempt < max_retries - 1:
+                        current_delay = _sleep_with_jitter(current_delay)
+            except Exception as e:
+                reason = str(e)
+                logger.debug("RBAC verification attempt %d failed: %s", attempt + 1, e)
+                if probe:
+                    # The API is still failing; reopen without spending the retry budget
+                    break
+                if attempt < max_retries - 1:
+                    current_delay = _sleep_with_jitter(current_delay)
+
+        # If we get here, verification never succeeded - log detailed error and raise
         logger.warning(f"RBAC permissions could not be verified for {service_account_name} to {verb} {resource}")
-        logger.warning(f"Tried API groups: {api_groups_to_try}")
+        logger.warning(f"Tried API group: {_MLFLOW_API_GROUP}")
+        if not api_responded:
+            with self._sar_circuit_lock:
+                self._sar_circuit_open_until = time.monotonic() + self.SAR_CIRCUIT_OPEN_SECONDS
+                self._sar_circuit_reason = reason
+                self._sar_circuit_probing = False
+            logger.warning(
+                "SubjectAccessReview API failed on every attempt, failing fast for %.0fs",
+                self.SAR_CIRCUIT_OPEN_SECONDS,
+            )
         raise RuntimeError(f"RBAC permissions could not be verified for {service_account_name} to {verb} {resource}, failed due to K8s error: {reason}")
+
+    def _close_sar_circuit(self) -> None:
+        """Close the SubjectAccessReview circuit after the API responded again."""
+        with self._sar_circuit_lock:
+            self._sar_circuit_open_until = 0.0
+            self._sar_circuit_probing = False
+
+    def invalidate_sar_cache(self, service_account_name: str, namespace: str) -> None:
+        """Drop cached SubjectAccessReview results for a ServiceAccount.
+
+        Args:
+            service_account_name: ServiceAccount whose cached results should be dropped
+            namespace: Namespace of the ServiceAccount
+        """
+        with self._sar_cache_lock:
+            stale_keys = [
+                key for key in self._sar_cache
+                if key[0] == service_account_name and key[1] == namespace
+            ]
+            for key in stale_keys:
+                del self._sar_cache[key]
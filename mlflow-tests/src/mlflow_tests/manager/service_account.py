@@ -2,7 +2,7 @@
 
 import logging
 import random
-import string
+import threading
 import time
 
 from kubernetes import client
@@ -11,10 +11,40 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# TokenRequest retry backoff: growth per attempt, relative jitter, and the ceiling on any delay
+_TOKEN_BACKOFF_MULTIPLIER = 1.5
+_TOKEN_BACKOFF_JITTER = 0.1
+_MAX_TOKEN_RETRY_DELAY_SECONDS = 30.0
+
+
+def _is_jwt_shape(token: str) -> bool:
+    """Return whether a token has the three dot-separated segments of a JWT."""
+    return token.count(".") == 2
+
+
+def _sleep_backoff(delay: float) -> float:
+    """Sleep for ``delay`` seconds and return the jittered delay for the next attempt.
+
+    Args:
+        delay: Delay in seconds for this attempt
+
+    Returns:
+        Next delay, grown by _TOKEN_BACKOFF_MULTIPLIER with ±10% jitter and capped at
+        _MAX_TOKEN_RETRY_DELAY_SECONDS
+    """
+    time.sleep(delay)
+    next_delay = delay * _TOKEN_BACKOFF_MULTIPLIER * random.uniform(
+        1 - _TOKEN_BACKOFF_JITTER, 1 + _TOKEN_BACKOFF_JITTER
+    )
+    return min(next_delay, _MAX_TOKEN_RETRY_DELAY_SECONDS)
+
 
 class ServiceAccountManager:
     """Class for managing Kubernetes ServiceAccounts."""
 
+    # Cached tokens are re-requested this long before they actually expire
+    TOKEN_EXPIRY_MARGIN_SECONDS = 300.0
+
     def __init__(self, core_v1_api: client.CoreV1Api):
         """Initialize the ServiceAccountManager with a Kubernetes CoreV1 API client.
 
@@ -22,16 +52,22 @@ class ServiceAccountManager:
             core_v1_api: Kubernetes CoreV1 API client
         """
         self.core_v1_api = core_v1_api
+        # (namespace, service_account) -> (token, reuse-until monotonic time)
+        self._token_cache: dict[tuple[str, str], tuple[str, float]] = {}
+        self._token_cache_lock = threading.Lock()
 
     def _create_service_account(
         self, name: str, namespace: str
-    ) -> None:
+    ) -> client.V1ServiceAccount:
         """Create a Kubernetes ServiceAccount.
 
         Args:
             name: ServiceAccount name
             namespace: Namespace for the ServiceAccount
 
+        Returns:
+            The created ServiceAccount, or the existing one if it already exists
+
         Raises:
             ApiException: If creation fails
         """
@@ -41,19 +77,16 @@ class ServiceAccountManager:
 
         try:
             logger.info(f"Creating service account '{name}' in namespace '{namespace}'")
-            self.core_v1_api.create_namespaced_service_account(
+            # The API server only responds once the object is persisted, so the
+            # returned ServiceAccount is ready to use without a follow-up read
+            created = self.core_v1_api.create_namespaced_service_account(
                 namespace=namespace, body=service_account
             )
-            # Wait for service account to be ready before proceeding
-            time.sleep(1)
-
-            # Verify the service account exists and is ready
-            self.core_v1_api.read_namespaced_service_account(name=name, namespace=namespace)
             logger.info(f"Service account '{name}' created successfully")
-            return None
+            return created
         except ApiException as e:
             if e.status == 409:  # Already exists, return existing one
-                logger.debug(f"Service account '{name}' already exists in namespace '{namespace}'")
+                logger.debug("Service account '%s' already exists in namespace '%s'", name, namespace)
                 try:
                     return self.core_v1_api.read_namespaced_service_account(
                         name=name, namespace=namespace
@@ -79,7 +112,7 @@ class ServiceAccountManager:
             service_account_name: ServiceAccount name to get token for
             namespace: Namespace of the ServiceAccount
             max_retries: Maximum number of retry attempts
-            retry_delay: Delay in seconds between retries
+            retry_delay: Initial delay in seconds between retries (jittered exponential backoff)
             token_expiration_seconds: Token validity duration in seconds (default: 1 hour)
 
         Returns:
@@ -91,13 +124,26 @@ class ServiceAccountManager:
 
         Note:
             Uses the modern TokenRequest API which is more secure than creating secrets.
-            Tokens are short-lived and don't persist in etcd.
+            Tokens are short-lived and don't persist in etcd. Issued tokens are reused
+            until TOKEN_EXPIRY_MARGIN_SECONDS before they expire.
         """
+        cache_key = (namespace, service_account_name)
+        with self._token_cache_lock:
+            cached = self._token_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[1]:
+            logger.debug("Using cached token for service account '%s'", service_account_name)
+            return cached[0]
+
         current_delay = retry_delay
 
         for attempt in range(max_retries):
             try:
-                logger.debug(f"Requesting token for service account '{service_account_name}' (attempt {attempt + 1}/{max_retries})")
+                logger.debug(
+                    "Requesting token for service account '%s' (attempt %d/%d)",
+                    service_account_name,
+                    attempt + 1,
+                    max_retries,
+                )
 
                 # Create TokenRequest spec
                 token_request_spec = client.V1TokenRequestSpec(
@@ -118,9 +164,8 @@ class ServiceAccountManager:
 
                 if not response or not response.status or not response.status.token:
                     if attempt < max_retries - 1:
-                        logger.debug(f"Token request returned empty response, retrying after {current_delay}s...")
-                        time.sleep(current_delay)
-                        current_delay *= 1.5  # Exponential backoff
+                        logger.debug("Token request returned empty response, retrying after %.2fs...", current_delay)
+                        current_delay = _sleep_backoff(current_delay)
                         continue
                     raise ValueError(f"TokenRequest API returned empty token for service account '{service_account_name}'")
 
@@ -129,25 +174,35 @@ class ServiceAccountManager:
                 # Validate token format
                 if not token or len(token) < 10:
                     if attempt < max_retries - 1:
-                        logger.debug(f"Retrieved token appears invalid (length: {len(token) if token else 0}), retrying after {current_delay}s...")
-                        time.sleep(current_delay)
-                        current_delay *= 1.5
+                        logger.debug(
+                            "Retrieved token appears invalid (length: %d), retrying after %.2fs...",
+                            len(token) if token else 0,
+                            current_delay,
+                        )
+                        current_delay = _sleep_backoff(current_delay)
                         continue
                     raise ValueError(f"Retrieved token appears invalid (length: {len(token) if token else 0})")
 
                 # Validate JWT format
-                parts = token.split('.')
-                if len(parts) != 3:
+                if not _is_jwt_shape(token):
                     if attempt < max_retries - 1:
-                        logger.debug(f"Token is not JWT format (has {len(parts)} parts, expected 3), retrying after {current_delay}s...")
-                        time.sleep(current_delay)
-                        current_delay *= 1.5
+                        logger.debug(
+                            "Token is not JWT format (has %d parts, expected 3), retrying after %.2fs...",
+                            token.count(".") + 1,
+                            current_delay,
+                        )
+                        current_delay = _sleep_backoff(current_delay)
                         continue
-                    logger.error(f"Token is not JWT format (has {len(parts)} parts, expected 3)")
+                    logger.error(f"Token is not JWT format (has {token.count('.') + 1} parts, expected 3)")
                     logger.error("MLflow requires JWT tokens for authentication")
                     # Still return it - let MLflow handle the error with better context
 
                 logger.info(f"Successfully retrieved token via TokenRequest API for '{service_account_name}' (length: {len(token)}, expires in {token_expiration_seconds}s)")
+                with self._token_cache_lock:
+                    self._token_cache[cache_key] = (
+                        token,
+                        time.monotonic() + token_expiration_seconds - self.TOKEN_EXPIRY_MARGIN_SECONDS,
+                    )
                 return token
 
             except ApiException as e:
@@ -155,9 +210,10 @@ class ServiceAccountManager:
                     logger.error(f"Failed to get token via TokenRequest API for '{service_account_name}' after {max_retries} retries: {e}")
                     raise
                 else:
-                    logger.debug(f"TokenRequest attempt {attempt + 1} failed: {e}, retrying after {current_delay}s...")
-                    time.sleep(current_delay)
-                    current_delay *= 1.5
+                    logger.debug(
+                        "TokenRequest attempt %d failed: %s, retrying after %.2fs...", attempt + 1, e, current_delay
+                    )
+                    current_delay = _sleep_backoff(current_delay)
 
         # This should not be reached, but added for safety
         raise RuntimeError(f"Failed to retrieve token via TokenRequest API for '{service_account_name}' after {max_retries} attempts")
@@ -178,20 +234,18 @@ class ServiceAccountManager:
 
         Note:
             This method uses the modern TokenRequest API approach:
-            1. Creates the service account and waits for it to be ready
+            1. Creates the service account (the create response confirms it is persisted)
             2. Uses TokenRequest API to get a short-lived JWT token
             3. No secrets are created, improving security and reducing cleanup overhead
         """
         logger.info(f"Starting service account creation workflow for '{sa_name}' in namespace '{namespace}' (using TokenRequest API)")
 
         try:
-            # Step 1: Create service account and wait for it to be ready
+            # Step 1: Create service account
             self._create_service_account(sa_name, namespace)
 
-            # Step 2: Get token using TokenRequest API
-            # Wait a brief moment for the service account to be fully propagated
-            time.sleep(0.5)
-
+            # Step 2: Get token using TokenRequest API. The request retries with backoff,
+            # which already covers any propagation delay after creation.
             token = self._get_token_via_token_request(sa_name, namespace)
 
             logger.info(f"Successfully completed service account creation workflow for '{sa_name}' using TokenRequest API")
@@ -219,6 +273,9 @@ class ServiceAccountManager:
             logger.warning(f"Namespace not provided for service account '{sa_name}' deletion. Unable to delete.")
             return
 
+        with self._token_cache_lock:
+            self._token_cache.pop((namespace, sa_name), None)
+
         try:
             logger.info(f"Deleting service account '{sa_name}' in namespace '{namespace}'")
 
@@ -231,14 +288,8 @@ class ServiceAccountManager:
 
         except ApiException as e:
             if e.status == 404:
-                logger.debug(f"Service account '{sa_name}' already deleted or not found in namespace '{namespace}'")
+                logger.debug("Service account '%s' already deleted or not found in namespace '%s'", sa_name, namespace)
             else:
                 error_msg = f"Failed to delete service account '{sa_name}': {e}"
                 logger.error(error_msg)
                 raise
-
-    def _get_random_string(self):
-        """Generate a random string for unique naming."""
-        letters = string.ascii_letters
-        random_string = ''.join(random.choices(letters, k=4))
-        return random_string.lower()
@@ -1,6 +1,7 @@
 """Kubernetes user management implementation."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Optional
 
 from kubernetes import client
@@ -11,6 +12,12 @@ from mlflow_tests.manager.service_account import ServiceAccountManager
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent SubjectAccessReview checks per role
+_MAX_VERIFY_WORKERS = 8
+
+# Verbs to verify a new role with, strongest first
+_VERIFY_VERB_PRIORITY = ("delete", "create", "update", "get", "list")
+
 
 class K8UserManager:
     """Kubernetes user manager.
@@ -74,7 +81,12 @@ class K8UserManager:
         resource_names = resource_names or {}
 
         logger.info(f"Creating K8s role '{role_name}' for user '{name}' in namespace '{workspace_name}'")
-        logger.debug(f"Role details - Verbs: {[v.value for v in verbs]}, Resources: {[r.value for r in resources]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Role details - Verbs: %s, Resources: %s",
+                [v.value for v in verbs],
+                [r.value for r in resources],
+            )
 
         # Get the verb strings and resources for logging
         verb_strings = [verb.value for verb in verbs]
@@ -89,65 +101,78 @@ class K8UserManager:
             logger.info(f"Subresources: {subresources}")
         logger.info("Additional permissions: Core K8s API (namespaces, serviceaccounts, secrets), RBAC read access")
 
-        # Create the role
-        self.role_manager.create_role(
-            role_name,
-            workspace_name,
-            verbs,
-            resources,
-            subresources,
-            resource_names,
-        )
-        logger.info(f"Created K8s role '{role_name}' with comprehensive permissions")
-
-        # Create the role binding
-        logger.debug(f"Creating role binding '{binding_name}' for user '{name}'")
-        self.role_manager.create_role_binding(
-            binding_name, workspace_name, role_name, name
-        )
+        # Apply the role and its binding together. Both are server-side applies and a
+        # binding may reference a Role that does not exist yet, so neither waits on the other.
+        logger.debug("Creating role binding '%s' for user '%s'", binding_name, name)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            role_future = executor.submit(
+                self.role_manager.create_role,
+                role_name,
+                workspace_name,
+                verbs,
+                resources,
+                subresources,
+                resource_names,
+            )
+            binding_future = executor.submit(
+                self.role_manager.create_role_binding,
+                binding_name,
+                workspace_name,
+                role_name,
+                name,
+            )
+            role_future.result()
+            logger.info(f"Created K8s role '{role_name}' with comprehensive permissions")
+            binding_future.result()
         logger.info(f"Successfully created and bound role '{role_name}' to user '{name}'")
 
         # Verify permissions are actually usable by performing SubjectAccessReview
-        logger.debug(f"Verifying RBAC permissions for user '{name}' are ready")
-        for resource in resources:
-            # Test the most important verb available (delete > create > update > get > list)
-            available_verbs = [v.value for v in verbs]
-            if "delete" in available_verbs:
-                test_verb = "delete"
-            elif "create" in available_verbs:
-                test_verb = "create"
-            elif "update" in available_verbs:
-                test_verb = "update"
-            elif "get" in available_verbs:
-                test_verb = "get"
-            elif "list" in available_verbs:
-                test_verb = "list"
-            else:
-                # Fallback to first available verb if none of the above match
-                test_verb = available_verbs[0] if available_verbs else "get"
-                logger.warning(f"Using fallback verb '{test_verb}' for RBAC verification")
-
-            try:
-                verification_resource_name = None
-                scoped_names = resource_names.get(resource, [])
-                if scoped_names:
-                    # Current scenarios scope to a single resource name. If future tests
-                    # grant multiple names for one resource type, expand this verification.
-                    verification_resource_name = scoped_names[0]
-
-                self.role_manager.verify_rbac_permissions(
-                    service_account_name=name,
-                    namespace=workspace_name,
-                    resource=resource.get_k8s_resource(),
-                    verb=test_verb,
-                    resource_name=verification_resource_name,
-                    max_retries=10,
-                    retry_delay=1.0
-                )
-                logger.info(f"RBAC verification passed for {name} - can {test_verb} {resource.get_k8s_resource()}")
-            except Exception as e:
-                logger.error(f"RBAC verification failed for user '{name}': {e}")
-                raise
+        logger.debug("Verifying RBAC permissions for user '%s' are ready", name)
+
+        # Test the most important verb available. The choice only depends on verbs,
+        # so make it once for all resources.
+        verb_set = {v.value for v in verbs}
+        test_verb = next((v for v in _VERIFY_VERB_PRIORITY if v in verb_set), None)
+        if test_verb is None:
+            # Fallback to first available verb if none of the prioritized ones match
+            test_verb = verbs[0].value if verbs else "get"
+            logger.warning(f"Using fallback verb '{test_verb}' for RBAC verification")
+
+        def verify_resource(resource: ResourceType, k8s_resource: str) -> None:
+            verification_resource_name = None
+            scoped_names = resource_names.get(resource, [])
+            if scoped_names:
+                # Current scenarios scope to a single resource name. If future tests
+                # grant multiple names for one resource type, expand this verification.
+                verification_resource_name = scoped_names[0]
+
+            self.role_manager.verify_rbac_permissions(
+                service_account_name=name,
+                namespace=workspace_name,
+                resource=k8s_resource,
+                verb=test_verb,
+                resource_name=verification_resource_name,
+                max_retries=10,
+                retry_delay=1.0
+            )
+            logger.info(f"RBAC verification passed for {name} - can {test_verb} {k8s_resource}")
+
+        # Each check is an independent, network-bound retry loop, so run them
+        # concurrently: wall time tracks the slowest resource, not the sum.
+        if resources:
+            with ThreadPoolExecutor(max_workers=min(_MAX_VERIFY_WORKERS, len(resources))) as executor:
+                futures = [
+                    executor.submit(verify_resource, resource, k8s_resource)
+                    for resource, k8s_resource in zip(resources, k8s_resources)
+                ]
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"RBAC verification failed for user '{name}': {e}")
+                        for pending in futures:
+                            pending.cancel()
+                        raise
 
         logger.info(f"User '{name}' now has {verb_strings} access to {len(resources)} resource types in namespace '{workspace_name}'")
 
@@ -171,31 +196,39 @@ class K8UserManager:
 
         logger.info(f"Deleting user '{username}' and associated RBAC resources in namespace '{namespace}'")
 
-        # Delete ServiceAccount
-        self.sa_manager.delete_service_account(username, namespace)
-
-        # Delete Role
         role_name = f"{username}-role"
-        try:
-            logger.info(f"Deleting role '{role_name}' in namespace '{namespace}'")
-            self.role_manager.rbac_v1_api.delete_namespaced_role(
-                name=role_name,
-                namespace=namespace
-            )
-            logger.info(f"Successfully deleted role '{role_name}'")
-        except Exception as e:
-            logger.warning(f"Failed to delete role '{role_name}': {e}")
-
-        # Delete RoleBinding
         binding_name = f"{username}-binding"
-        try:
-            logger.info(f"Deleting role binding '{binding_name}' in namespace '{namespace}'")
-            self.role_manager.rbac_v1_api.delete_namespaced_role_binding(
-                name=binding_name,
-                namespace=namespace
-            )
-            logger.info(f"Successfully deleted role binding '{binding_name}'")
-        except Exception as e:
-            logger.warning(f"Failed to delete role binding '{binding_name}': {e}")
+
+        def delete_role() -> None:
+            try:
+                logger.info(f"Deleting role '{role_name}' in namespace '{namespace}'")
+                self.role_manager.rbac_v1_api.delete_namespaced_role(
+                    name=role_name,
+                    namespace=namespace
+                )
+                logger.info(f"Successfully deleted role '{role_name}'")
+            except Exception as e:
+                logger.warning(f"Failed to delete role '{role_name}': {e}")
+
+        def delete_role_binding() -> None:
+            try:
+                logger.info(f"Deleting role binding '{binding_name}' in namespace '{namespace}'")
+                self.role_manager.rbac_v1_api.delete_namespaced_role_binding(
+                    name=binding_name,
+                    namespace=namespace
+                )
+                logger.info(f"Successfully deleted role binding '{binding_name}'")
+            except Exception as e:
+                logger.warning(f"Failed to delete role binding '{binding_name}': {e}")
+
+        # The three deletes are independent, so issue them together. Role and binding
+        # failures are logged by their helpers; a ServiceAccount failure is re-raised
+        # once the RBAC deletes have finished.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            sa_future = executor.submit(self.sa_manager.delete_service_account, username, namespace)
+            executor.submit(delete_role)
+            executor.submit(delete_role_binding)
+        self.role_manager.invalidate_sar_cache(username, namespace)
+        sa_future.result()
 
         logger.info(f"Completed deletion of user '{username}' and associated resources")
\ No newline at end of file
@@ -1,44 +1,146 @@
 """Client creation utilities for Kubernetes and MLflow."""
 
+import functools
+import hashlib
 import os
 import logging
 import threading
-from typing import Optional
+from typing import ClassVar, Optional
 
+import mlflow
 from kubernetes import client, config
 from kubernetes.client import Configuration
 from mlflow.tracking import MlflowClient
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 # Module-level lock to synchronize MLflow client creation
 _mlflow_client_lock = threading.Lock()
 
+# Environment variables MLflow reads its tracking credentials from
+_MLFLOW_AUTH_ENV_VARS = ('MLFLOW_TRACKING_USERNAME', 'MLFLOW_TRACKING_PASSWORD', 'MLFLOW_TRACKING_TOKEN')
+
+# Default floor for the urllib3 pool behind the Kubernetes API clients. Parallel RBAC
+# verification and cleanup issue concurrent requests; with a smaller pool the
+# surplus connections are opened and discarded on every burst. Override with
+# K8S_POOL_MAXSIZE.
+_DEFAULT_K8S_CONNECTION_POOL_MAXSIZE = 32
+
+# Transport-level retries for the Kubernetes API clients, so a transient 429/5xx
+# from the API server does not fail a test. Only idempotent methods are retried:
+# POST and PATCH are excluded because a create whose response is lost would come
+# back as a 409, and several callers send merge patches. Once retries run out the
+# last response is returned instead of raising, so callers still see ApiException.
+_K8S_RETRIES = Retry(
+    total=5,
+    backoff_factor=0.2,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+    raise_on_status=False,
+)
+
+
+def _k8s_pool_maxsize() -> int:
+    """Return the Kubernetes connection pool floor from K8S_POOL_MAXSIZE.
+
+    Invalid or non-positive values fall back to the default with a warning.
+    """
+    value = os.getenv("K8S_POOL_MAXSIZE")
+    if value is None:
+        return _DEFAULT_K8S_CONNECTION_POOL_MAXSIZE
+    try:
+        pool_maxsize = int(value)
+    except ValueError:
+        pool_maxsize = 0
+    if pool_maxsize < 1:
+        logger.warning(
+            "Ignoring invalid K8S_POOL_MAXSIZE=%r; expected a positive integer, using %d",
+            value,
+            _DEFAULT_K8S_CONNECTION_POOL_MAXSIZE,
+        )
+        return _DEFAULT_K8S_CONNECTION_POOL_MAXSIZE
+    return pool_maxsize
+
+
+@functools.lru_cache(maxsize=32)
+def _build_mlflow_client(tracking_uri: Optional[str], username: Optional[str], secret_hash: str) -> MlflowClient:
+    """Build an MlflowClient, memoized per tracking URI and credential.
+
+    The username and secret hash only key the cache; MLflow reads the credentials
+    themselves from the environment on every request.
+    """
+    return MlflowClient(tracking_uri=tracking_uri)
+
 
 class ClientManager:
 
+    # One ApiClient shared by every Kubernetes API wrapper, so CoreV1 and RBAC calls
+    # reuse the same connection pool and TLS sessions
+    _shared_api_client: ClassVar[Optional[client.ApiClient]] = None
+    _k8s_clients: ClassVar[Optional[tuple[client.CoreV1Api, client.RbacAuthorizationV1Api]]] = None
+    _shared_api_client_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @staticmethod
     def load_k8s_config() -> None:
-        """Load Kubernetes config."""
+        """Load Kubernetes config, size its connection pool for concurrent use and enable retries."""
         try:
             config.load_incluster_config()
         except config.ConfigException:
             config.load_kube_config()
 
+        configuration = Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = max(
+            configuration.connection_pool_maxsize, _k8s_pool_maxsize()
+        )
+        configuration.retries = _K8S_RETRIES
+        Configuration.set_default(configuration)
+
     @classmethod
     def create_k8s_client(cls) -> tuple[client.CoreV1Api, client.RbacAuthorizationV1Api]:
         """Create Kubernetes API clients.
 
+        The clients are built once around the shared ApiClient and reused until
+        close_k8s_client() is called.
+
         Returns:
             Tuple of (CoreV1Api, RbacAuthorizationV1Api) clients
         """
-        cls.load_k8s_config()
+        api_client = cls.get_k8s_api_client()
 
-        core_v1_api = client.CoreV1Api()
-        rbac_v1_api = client.RbacAuthorizationV1Api()
+        with cls._shared_api_client_lock:
+            if cls._k8s_clients is None:
+                core_v1_api = client.CoreV1Api(api_client)
+                rbac_v1_api = client.RbacAuthorizationV1Api(api_client)
+                cls._k8s_clients = (core_v1_api, rbac_v1_api)
+            return cls._k8s_clients
 
-        return core_v1_api, rbac_v1_api
+    @classmethod
+    def get_k8s_api_client(cls) -> client.ApiClient:
+        """Return the shared Kubernetes ApiClient, loading config on first use.
 
+        Returns:
+            ApiClient shared by all Kubernetes API wrappers
+        """
+        with cls._shared_api_client_lock:
+            if cls._shared_api_client is None:
+                cls.load_k8s_config()
+                cls._shared_api_client = client.ApiClient()
+            return cls._shared_api_client
+
+    @classmethod
+    def close_k8s_client(cls) -> None:
+        """Close the shared Kubernetes ApiClient and drop the clients built on it."""
+        with cls._shared_api_client_lock:
+            cls._k8s_clients = None
+            if cls._shared_api_client is not None:
+                cls._shared_api_client.close()
+                cls._shared_api_client = None
+
+    @staticmethod
+    def clear_mlflow_client_cache() -> None:
+        """Drop cached MLflow clients."""
+        _build_mlflow_client.cache_clear()
 
     @classmethod
     def create_mlflow_client(cls,
@@ -67,11 +169,12 @@ class ClientManager:
                        or partial credentials are provided (username without password or vice versa)
 
         Note:
-            This function clears all MLflow auth environment variables first to ensure
-            clean state, then sets only the appropriate credentials for the auth mode.
-            The entire operation is synchronized with a module-level lock to prevent races.
+            This function sets only the appropriate credentials for the auth mode and
+            removes any other MLflow auth environment variables, writing only what changed.
+            The tracking URI and environment update are synchronized with a module-level lock.
+            Clients are cached per (tracking URI, username, credential hash).
         """
-        logger.debug(f"Creating MLflow client with tracking_uri={tracking_uri}")
+        logger.debug("Creating MLflow client with tracking_uri=%s", tracking_uri)
 
         # Validate credentials - if username or password is provided, both must be provided
         username_provided = username is not None and username != ""
@@ -81,45 +184,47 @@ class ClientManager:
         if password_provided and not username_provided:
             raise ValueError("Username must be provided when password is specified")
 
-        # Use module-level lock to make the entire operation atomic
+        # Decide the credentials for the auth mode before taking the lock, so the
+        # critical section only covers the process-global state MLflow reads
+        desired_env: dict[str, str] = {}
+        if username_provided and password_provided:
+            # LOCAL mode: Basic authentication
+            logger.debug("Setting up Basic Auth with username: %s", username)
+            desired_env = {'MLFLOW_TRACKING_USERNAME': username, 'MLFLOW_TRACKING_PASSWORD': password}
+            logger.info(f"MLflow client configured for Basic Auth (LOCAL mode) with user: {username}")
+
+        elif token:
+            # K8s mode: Bearer token authentication
+            logger.debug("Setting up Bearer token authentication (token length: %d)", len(token))
+            desired_env = {'MLFLOW_TRACKING_TOKEN': token}
+            logger.info("MLflow client configured for Bearer token auth (K8s mode)")
+
+        else:
+            # No credentials provided - client will use default/anonymous access
+            logger.warning("No authentication credentials provided to MLflow client. "
+                          "Client will attempt unauthenticated access.")
+
+        secret = password if username_provided else token
+        secret_hash = hashlib.sha256((secret or "").encode()).hexdigest()
+
+        # Use module-level lock to make the global tracking URI and credential update atomic
         with _mlflow_client_lock:
-            # Clear all MLflow authentication environment variables to ensure clean state
-            # This prevents credential leakage between different authentication contexts
-            auth_vars = ['MLFLOW_TRACKING_USERNAME', 'MLFLOW_TRACKING_PASSWORD', 'MLFLOW_TRACKING_TOKEN']
-            for var in auth_vars:
-                if var in os.environ:
-                    logger.debug(f"Clearing existing environment variable: {var}")
-                    del os.environ[var]
-
-            # Set tracking URI first
-            import mlflow
-            mlflow.set_tracking_uri(tracking_uri)
-            logger.debug(f"Set MLflow tracking URI to: {tracking_uri}")
-
-            # Set appropriate authentication credentials based on mode
-            if username_provided and password_provided:
-                # LOCAL mode: Basic authentication
-                logger.debug(f"Setting up Basic Auth with username: {username}")
-                os.environ['MLFLOW_TRACKING_USERNAME'] = username
-                os.environ['MLFLOW_TRACKING_PASSWORD'] = password
-                logger.info(f"MLflow client configured for Basic Auth (LOCAL mode) with user: {username}")
-
-            elif token:
-                # K8s mode: Bearer token authentication
-                logger.debug(f"Setting up Bearer token authentication (token length: {len(token) if token else 0})")
-                os.environ['MLFLOW_TRACKING_TOKEN'] = token
-                logger.info("MLflow client configured for Bearer token auth (K8s mode)")
-
-            else:
-                # No credentials provided - client will use default/anonymous access
-                logger.warning("No authentication credentials provided to MLflow client. "
-                              "Client will attempt unauthenticated access.")
-
-            # Create client - it will read credentials from environment variables we just set
-            mlflow_client = MlflowClient(tracking_uri=tracking_uri)
-
-            # Verify credentials were read by inspecting the client's internal state
-            # Note: This is for debugging only; MlflowClient doesn't expose credentials directly
-            logger.debug("MLflow client created successfully")
-
-            return mlflow_client
+            # Setting the URI also resets MLflow's tracing state, so skip it when unchanged
+            if tracking_uri is None or mlflow.get_tracking_uri() != tracking_uri:
+                mlflow.set_tracking_uri(tracking_uri)
+
+            # Only touch auth variables whose value changes; anything not part of this
+            # mode is removed so credentials never leak between authentication contexts
+            for var in _MLFLOW_AUTH_ENV_VARS:
+                value = desired_env.get(var)
+                if value is None:
+                    os.environ.pop(var, None)
+                elif os.environ.get(var) != value:
+                    os.environ[var] = value
+
+            # Reuse the client for this identity - requests read the credentials from the
+            # environment variables we just set, so a cached client is as good as a new one
+            mlflow_client = _build_mlflow_client(tracking_uri, username if username_provided else None, secret_hash)
+
+        logger.debug("MLflow client created successfully")
+        return mlflow_client
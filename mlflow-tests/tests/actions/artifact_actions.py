@@ -4,6 +4,8 @@ This module contains all action functions for artifact and model logging operati
 Each action accepts only test_context as an argument and modifies it appropriately.
 """
 
+import copy
+import functools
 import logging
 import os
 import tempfile
@@ -13,7 +15,6 @@ import mlflow
 from kubernetes import client
 from mlflow.exceptions import MlflowException
 from requests import exceptions as requests_exceptions
-from sklearn.linear_model import LinearRegression
 from mlflow_tests.utils.client import ClientManager
 from ..shared import TestContext
 from ..constants.config import Config
@@ -23,8 +24,8 @@ logger = logging.getLogger(__name__)
 
 def _get_k8s_clients():
     """Get Kubernetes API clients."""
-    ClientManager.load_k8s_config()
-    return client.CoreV1Api(), client.CustomObjectsApi()
+    api_client = ClientManager.get_k8s_api_client()
+    return client.CoreV1Api(api_client), client.CustomObjectsApi(api_client)
 
 
 def _require_active_namespace(test_context: TestContext) -> str:
@@ -97,15 +98,15 @@ def action_start_run(test_context: TestContext) -> None:
     Raises:
         Exception: If run creation fails (propagated from mlflow).
     """
-    logger.info(f"Starting MLflow run in experiment {test_context.active_experiment_id}")
+    logger.info("Starting MLflow run in experiment %s", test_context.active_experiment_id)
 
     run = mlflow.start_run(experiment_id=test_context.active_experiment_id)
     test_context.current_run_id = run.info.run_id
-    logger.info(f"Successfully started run {test_context.current_run_id}")
+    logger.info("Successfully started run %s", test_context.current_run_id)
 
     # Add to cleanup tracker with workspace context
     test_context.add_run_for_cleanup(test_context.current_run_id, test_context.active_workspace)
-    logger.debug(f"Added run {test_context.current_run_id} to cleanup list for workspace '{test_context.active_workspace}'")
+    logger.debug("Added run %s to cleanup list for workspace '%s'", test_context.current_run_id, test_context.active_workspace)
 
 
 def action_end_run(test_context: TestContext) -> None:
@@ -118,10 +119,10 @@ def action_end_run(test_context: TestContext) -> None:
     Raises:
         Exception: If ending run fails (propagated from mlflow).
     """
-    logger.info(f"Ending MLflow run {test_context.current_run_id}")
+    logger.info("Ending MLflow run %s", test_context.current_run_id)
 
     mlflow.end_run()
-    logger.info(f"Successfully ended run {test_context.current_run_id}")
+    logger.info("Successfully ended run %s", test_context.current_run_id)
 
 
 def action_create_temp_artifact(test_context: TestContext) -> None:
@@ -131,6 +132,7 @@ def action_create_temp_artifact(test_context: TestContext) -> None:
         test_context: Test context to update.
                      Updates temp_artifact_path with file path.
                      Updates temp_artifact_content with file content.
+                     Adds the file to temp_paths_to_delete for cleanup.
 
     Raises:
         Exception: If file creation fails (propagated from OS).
@@ -138,12 +140,19 @@ def action_create_temp_artifact(test_context: TestContext) -> None:
     logger.info("Creating temporary artifact file")
 
     content = "test artifact content"
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(content)
-        test_context.temp_artifact_path = f.name
-        test_context.temp_artifact_content = content
+    # mlflow.log_artifact needs a real path; write the tiny payload with one
+    # unbuffered write instead of going through a buffered file object
+    path = os.path.join(tempfile.gettempdir(), f"mlflow-art-{uuid.uuid4().hex}.txt")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+    test_context.temp_artifact_path = path
+    test_context.temp_artifact_content = content
+    test_context.add_temp_path_for_cleanup(path)
 
-    logger.info(f"Successfully created temporary artifact at {test_context.temp_artifact_path}")
+    logger.info("Successfully created temporary artifact at %s", test_context.temp_artifact_path)
 
 
 def action_log_artifact(test_context: TestContext) -> None:
@@ -156,10 +165,10 @@ def action_log_artifact(test_context: TestContext) -> None:
     Raises:
         Exception: If artifact logging fails (propagated from mlflow).
     """
-    logger.info(f"Logging artifact {test_context.temp_artifact_path} to run {test_context.current_run_id}")
+    logger.info("Logging artifact %s to run %s", test_context.temp_artifact_path, test_context.current_run_id)
 
     mlflow.log_artifact(test_context.temp_artifact_path)
-    logger.info(f"Successfully logged artifact {os.path.basename(test_context.temp_artifact_path)}")
+    logger.info("Successfully logged artifact %s", os.path.basename(test_context.temp_artifact_path))
 
 
 def action_list_artifacts(test_context: TestContext) -> None:
@@ -172,11 +181,11 @@ def action_list_artifacts(test_context: TestContext) -> None:
     Raises:
         Exception: If artifact listing fails (propagated from mlflow).
     """
-    logger.info(f"Listing artifacts for run {test_context.current_run_id}")
+    logger.info("Listing artifacts for run %s", test_context.current_run_id)
 
     # Use the authenticated client from test context
     test_context.artifact_list = test_context.user_client.list_artifacts(test_context.current_run_id)
-    logger.info(f"Successfully listed {len(test_context.artifact_list)} artifact(s)")
+    logger.info("Successfully listed %d artifact(s)", len(test_context.artifact_list))
 
 
 def action_download_artifact(test_context: TestContext) -> None:
@@ -190,13 +199,29 @@ def action_download_artifact(test_context: TestContext) -> None:
         Exception: If artifact download fails (propagated from mlflow).
     """
     artifact_path = os.path.basename(test_context.temp_artifact_path)
-    logger.info(f"Downloading artifact '{artifact_path}' from run {test_context.current_run_id}")
+    logger.info("Downloading artifact '%s' from run %s", artifact_path, test_context.current_run_id)
 
     test_context.downloaded_path = mlflow.artifacts.download_artifacts(
         run_id=test_context.current_run_id,
         artifact_path=artifact_path
     )
-    logger.info(f"Successfully downloaded artifact to {test_context.downloaded_path}")
+    logger.info("Successfully downloaded artifact to %s", test_context.downloaded_path)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_prototype_model():
+    """Train the reference LinearRegression model once per worker."""
+    # Imported here so collecting the suite does not pay for loading sklearn
+    from sklearn.linear_model import LinearRegression
+
+    logger.info("Creating and training sklearn LinearRegression model")
+
+    model = LinearRegression()
+    # Train on simple data: y = 2*x + 1
+    X = [[1], [2], [3]]
+    y = [3, 5, 7]
+    model.fit(X, y)
+    return model
 
 
 def action_create_model(test_context: TestContext) -> None:
@@ -209,15 +234,8 @@ def action_create_model(test_context: TestContext) -> None:
     Raises:
         Exception: If model creation fails (propagated from sklearn).
     """
-    logger.info("Creating and training sklearn LinearRegression model")
-
-    model = LinearRegression()
-    # Train on simple data: y = 2*x + 1
-    X = [[1], [2], [3]]
-    y = [3, 5, 7]
-    model.fit(X, y)
-
-    test_context.model = model
+    # The training data is constant, so copy the fitted prototype instead of refitting
+    test_context.model = copy.deepcopy(_get_prototype_model())
     logger.info("Successfully created and trained model")
 
 
@@ -231,11 +249,11 @@ def action_log_model(test_context: TestContext) -> None:
     Raises:
         Exception: If model logging fails (propagated from mlflow).
     """
-    logger.info(f"Logging model to run {test_context.current_run_id}")
+    logger.info("Logging model to run %s", test_context.current_run_id)
 
     model_info = mlflow.sklearn.log_model(test_context.model, "model")
     test_context.model_uri = model_info.model_uri
-    logger.info(f"Successfully logged model with URI: {test_context.model_uri}")
+    logger.info("Successfully logged model with URI: %s", test_context.model_uri)
 
 
 def action_load_model(test_context: TestContext) -> None:
@@ -248,7 +266,7 @@ def action_load_model(test_context: TestContext) -> None:
     Raises:
         Exception: If model loading fails (propagated from mlflow).
     """
-    logger.info(f"Loading model from URI: {test_context.model_uri}")
+    logger.info("Loading model from URI: %s", test_context.model_uri)
 
     test_context.model = mlflow.sklearn.load_model(test_context.model_uri)
     logger.info("Successfully loaded model")
@@ -264,12 +282,12 @@ def action_get_run_info(test_context: TestContext) -> None:
     Raises:
         Exception: If run retrieval fails (propagated from mlflow).
     """
-    logger.info(f"Retrieving run info for run_id: {test_context.current_run_id}")
+    logger.info("Retrieving run info for run_id: %s", test_context.current_run_id)
 
-    run = mlflow.get_run(test_context.current_run_id)
+    run = test_context.user_client.get_run(test_context.current_run_id)
     test_context.artifact_location = run.info.artifact_uri
 
-    logger.info(f"Successfully retrieved run info, artifact location: {test_context.artifact_location}")
+    logger.info("Successfully retrieved run info, artifact location: %s", test_context.artifact_location)
 
 
 def action_create_artifact_connection_secret(test_context: TestContext) -> None:
@@ -288,7 +306,7 @@ def action_create_artifact_connection_secret(test_context: TestContext) -> None:
     secret_name = "mlflow-artifact-connection"
     access_key, secret_key, s3_url, bucket_name = _require_artifact_override_s3_config()
 
-    logger.info(f"Creating artifact connection secret '{secret_name}' in namespace '{namespace}'")
+    logger.info("Creating artifact connection secret '%s' in namespace '%s'", secret_name, namespace)
 
     core_v1_api, _ = _get_k8s_clients()
     expected_secret_data = {
@@ -309,7 +327,7 @@ def action_create_artifact_connection_secret(test_context: TestContext) -> None:
     try:
         core_v1_api.create_namespaced_secret(namespace=namespace, body=secret)
         created_secret = True
-        logger.info(f"Successfully created secret '{secret_name}' in namespace '{namespace}'")
+        logger.info("Successfully created secret '%s' in namespace '%s'", secret_name, namespace)
     except client.ApiException as e:
         if e.status == 409:
             core_v1_api.patch_namespaced_secret(
@@ -317,7 +335,7 @@ def action_create_artifact_connection_secret(test_context: TestContext) -> None:
                 namespace=namespace,
                 body={"stringData": expected_secret_data},
             )
-            logger.info(f"Patched secret '{secret_name}' in namespace '{namespace}'")
+            logger.info("Patched secret '%s' in namespace '%s'", secret_name, namespace)
         else:
             raise
 
@@ -342,7 +360,7 @@ def action_wait_for_mlflowconfig_active(test_context: TestContext) -> None:
         )
     expected_prefix = f"s3://{expected_bucket}/{path}/"
 
-    logger.info(f"Polling for MLflowConfig to become active (path: '{path}')")
+    logger.info("Polling for MLflowConfig to become active (path: '%s')", path)
 
     last_error: Exception | None = None
     for i in range(10):
@@ -352,7 +370,7 @@ def action_wait_for_mlflowconfig_active(test_context: TestContext) -> None:
             location = mlflow.get_experiment(exp_id).artifact_location
 
             if location and location.startswith(expected_prefix):
-                logger.info(f"MLflowConfig active after {i + 1} attempt(s)")
+                logger.info("MLflowConfig active after %d attempt(s)", i + 1)
                 return
         except Exception as exc:
             if not _is_retryable_probe_error(exc):
@@ -388,7 +406,7 @@ def action_create_mlflowconfig(test_context: TestContext) -> None:
     config_name = "mlflow"
     artifact_path = "custom-artifacts"
 
-    logger.info(f"Creating MLflowConfig '{config_name}' in namespace '{namespace}' with path '{artifact_path}'")
+    logger.info("Creating MLflowConfig '%s' in namespace '%s' with path '%s'", config_name, namespace, artifact_path)
 
     _, custom_api = _get_k8s_clients()
 
@@ -415,7 +433,7 @@ def action_create_mlflowconfig(test_context: TestContext) -> None:
             body=mlflowconfig
         )
         created_mlflowconfig = True
-        logger.info(f"Successfully created MLflowConfig '{config_name}' in namespace '{namespace}'")
+        logger.info("Successfully created MLflowConfig '%s' in namespace '%s'", config_name, namespace)
     except client.ApiException as e:
         if e.status == 409:
             custom_api.patch_namespaced_custom_object(
@@ -426,7 +444,7 @@ def action_create_mlflowconfig(test_context: TestContext) -> None:
                 name=config_name,
                 body={"spec": mlflowconfig["spec"]},
             )
-            logger.info(f"Patched MLflowConfig '{config_name}' in namespace '{namespace}'")
+            logger.info("Patched MLflowConfig '%s' in namespace '%s'", config_name, namespace)
         else:
             raise
 
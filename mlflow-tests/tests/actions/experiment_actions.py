@@ -5,15 +5,13 @@ Each action accepts only test_context as an argument and modifies it appropriate
 """
 
 import logging
-import random
-import mlflow
+import secrets
 from mlflow.exceptions import MlflowException
 from mlflow_tests.enums import ResourceType
 from ..shared import TestContext
 from ..shared.resource_map import get_resource_entry
 
 logger = logging.getLogger(__name__)
-random_gen = random.Random()
 
 
 def action_get_experiment(test_context: TestContext) -> None:
@@ -26,7 +24,7 @@ def action_get_experiment(test_context: TestContext) -> None:
     Raises:
         Exception: If experiment retrieval fails (propagated from mlflow).
     """
-    logger.info(f"Starting experiment retrieval in workspace '{test_context.active_workspace}'")
+    logger.info("Starting experiment retrieval in workspace '%s'", test_context.active_workspace)
 
     # Most read-path scenarios preselect the exact experiment ID in the test
     # harness. Keep this fallback so callers that only set workspace context
@@ -38,13 +36,13 @@ def action_get_experiment(test_context: TestContext) -> None:
             ResourceType.EXPERIMENTS,
             test_context.active_workspace,
         )["id"]
-    logger.debug(f"Retrieving experiment with ID: {experiment_id}")
+    logger.debug("Retrieving experiment with ID: %s", experiment_id)
 
-    experiment = mlflow.get_experiment(experiment_id)
+    experiment = test_context.user_client.get_experiment(experiment_id)
     test_context.active_experiment_id = experiment.experiment_id if experiment else None
 
     if experiment:
-        logger.info(f"Successfully retrieved experiment '{experiment.name}' (ID: {experiment.experiment_id})")
+        logger.info("Successfully retrieved experiment '%s' (ID: %s)", experiment.name, experiment.experiment_id)
     else:
         logger.warning(f"Experiment retrieval returned None for ID: {experiment_id}")
 
@@ -66,11 +64,17 @@ def action_create_experiment(test_context: TestContext, max_retries: int = 3) ->
                    or if all retries are exhausted.
     """
     for attempt in range(1, max_retries + 1):
-        experiment_name = f"test-experiment-{random_gen.randint(0, 1_000_000)}"
-        logger.info(f"Starting experiment creation in workspace '{test_context.active_workspace}' with name '{experiment_name}' (attempt {attempt}/{max_retries})")
+        experiment_name = f"test-experiment-{secrets.token_hex(4)}"
+        logger.info(
+            "Starting experiment creation in workspace '%s' with name '%s' (attempt %d/%d)",
+            test_context.active_workspace,
+            experiment_name,
+            attempt,
+            max_retries,
+        )
 
         try:
-            experiment_id = mlflow.create_experiment(experiment_name)
+            experiment_id = test_context.user_client.create_experiment(experiment_name)
         except MlflowException as e:
             if e.error_code == "RESOURCE_ALREADY_EXISTS" and attempt < max_retries:
                 logger.warning(f"Experiment name '{experiment_name}' already exists, retrying with a new name")
@@ -78,10 +82,10 @@ def action_create_experiment(test_context: TestContext, max_retries: int = 3) ->
             raise
 
         test_context.active_experiment_id = experiment_id
-        logger.info(f"Successfully created experiment '{experiment_name}' with ID: {experiment_id}")
+        logger.info("Successfully created experiment '%s' with ID: %s", experiment_name, experiment_id)
 
         test_context.add_experiment_for_cleanup(experiment_id, test_context.active_workspace)
-        logger.debug(f"Added experiment {experiment_id} to cleanup list for workspace '{test_context.active_workspace}'")
+        logger.debug("Added experiment %s to cleanup list for workspace '%s'", experiment_id, test_context.active_workspace)
         return
 
 
@@ -97,6 +101,6 @@ def action_delete_experiment(test_context: TestContext) -> None:
     """
 
     # Delete experiment
-    logger.debug(f"Deleting experiment {test_context.active_experiment_id}")
-    mlflow.delete_experiment(test_context.active_experiment_id)
-    logger.info(f"Successfully deleted experiment {test_context.active_experiment_id}")
+    logger.debug("Deleting experiment %s", test_context.active_experiment_id)
+    test_context.user_client.delete_experiment(test_context.active_experiment_id)
+    logger.info("Successfully deleted experiment %s", test_context.active_experiment_id)
@@ -5,14 +5,13 @@ Each action accepts only test_context as an argument and modifies it appropriate
 """
 
 import logging
-import random
+import secrets
 import mlflow
 from mlflow_tests.enums import ResourceType
 from ..shared import TestContext
 from ..shared.resource_map import get_resource_entry
 
 logger = logging.getLogger(__name__)
-random_gen = random.Random()
 
 
 def action_get_registered_model(test_context: TestContext) -> None:
@@ -25,7 +24,7 @@ def action_get_registered_model(test_context: TestContext) -> None:
     Raises:
         Exception: If model retrieval fails (propagated from mlflow).
     """
-    logger.info(f"Starting registered model retrieval in workspace '{test_context.active_workspace}'")
+    logger.info("Starting registered model retrieval in workspace '%s'", test_context.active_workspace)
 
     # Most read-path scenarios preselect the exact model name in the test
     # harness. Keep this fallback so callers that only set workspace context
@@ -37,13 +36,13 @@ def action_get_registered_model(test_context: TestContext) -> None:
             ResourceType.REGISTERED_MODELS,
             test_context.active_workspace,
         )["name"]
-    logger.debug(f"Retrieving registered model with name: {model_name}")
+    logger.debug("Retrieving registered model with name: %s", model_name)
 
     model = test_context.user_client.get_registered_model(model_name)
     test_context.active_model_name = model.name if model else None
 
     if model:
-        logger.info(f"Successfully retrieved registered model '{model.name}'")
+        logger.info("Successfully retrieved registered model '%s'", model.name)
     else:
         logger.warning(f"Registered model retrieval returned None for name: {model_name}")
 
@@ -59,16 +58,16 @@ def action_create_registered_model(test_context: TestContext) -> None:
     Raises:
         Exception: If model creation fails (propagated from mlflow).
     """
-    model_name = f"test-model-{random_gen.randint(0, 10_000)}"
-    logger.info(f"Starting registered model creation in workspace '{test_context.active_workspace}' with name '{model_name}'")
+    model_name = f"test-model-{secrets.token_hex(4)}"
+    logger.info("Starting registered model creation in workspace '%s' with name '%s'", test_context.active_workspace, model_name)
 
     model = test_context.user_client.create_registered_model(model_name)
     test_context.active_model_name = model.name
-    logger.info(f"Successfully created registered model '{model_name}'")
+    logger.info("Successfully created registered model '%s'", model_name)
 
     # Add to cleanup tracker with workspace context
     test_context.add_model_for_cleanup(model.name, test_context.active_workspace)
-    logger.debug(f"Added model {model.name} to cleanup list for workspace '{test_context.active_workspace}'")
+    logger.debug("Added model %s to cleanup list for workspace '%s'", model.name, test_context.active_workspace)
 
 
 def action_delete_registered_model(test_context: TestContext) -> None:
@@ -82,6 +81,6 @@ def action_delete_registered_model(test_context: TestContext) -> None:
     """
 
     # Delete registered model
-    logger.debug(f"Step 2: Deleting registered model {test_context.active_model_name}")
+    logger.debug("Step 2: Deleting registered model %s", test_context.active_model_name)
     test_context.user_client.delete_registered_model(test_context.active_model_name)
-    logger.info(f"Successfully deleted registered model {test_context.active_model_name}")
+    logger.info("Successfully deleted registered model %s", test_context.active_model_name)
@@ -23,7 +23,7 @@ def action_list_workspaces(test_context: TestContext) -> None:
     url = f"{get_mlflow_base_uri()}/ajax-api/3.0/mlflow/workspaces"
     headers = {"Authorization": f"Bearer {Config.K8_API_TOKEN}"}
 
-    logger.info(f"Listing workspaces via {url}")
+    logger.info("Listing workspaces via %s", url)
     resp = requests.get(
         url,
         headers=headers,
@@ -2,12 +2,14 @@ import os
 import logging
 import random
 import string
-from typing import ClassVar
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ClassVar
 
 import mlflow
 import pytest
 from kubernetes import client as k8s_client
 from mlflow.client import MlflowClient
+from mlflow.exceptions import MlflowException
 
 from mlflow_tests.enums import ResourceType, KubeVerb
 from mlflow_tests.manager.user import K8UserManager
@@ -29,6 +31,9 @@ logger = logging.getLogger(__name__)
 
 random_gen = random.Random()
 
+# Upper bound on concurrent deletes per resource group during test cleanup
+_CLEANUP_MAX_WORKERS = 16
+
 
 def set_user_context(user_info: tuple[str, str]) -> MlflowClient:
     """Set user context for MLflow authentication and return authenticated client.
@@ -196,102 +201,94 @@ class TestBase:
         cleanup_errors = []
 
         # Cleanup experiments with workspace awareness
+        def delete_experiment(experiment_id: str, workspace: str) -> str | None:
+            try:
+                # Delete directly; the server rejects experiments that are already deleted
+                # or missing with RESOURCE_DOES_NOT_EXIST, so no lookup is needed first
+                self.admin_client.delete_experiment(experiment_id)
+                logger.info(f"Deleted experiment {experiment_id} in workspace {workspace}")
+            except Exception as e:
+                if isinstance(e, MlflowException) and e.error_code == "RESOURCE_DOES_NOT_EXIST":
+                    logger.debug(f"Experiment {experiment_id} already deleted or not found")
+                    return None
+                # Log error but continue cleanup
+                error_msg = f"Failed to delete experiment {experiment_id} in workspace {workspace}: {e}"
+                logger.warning(error_msg)
+                return error_msg
+            return None
+
         if self.test_context.experiments_to_delete:
             logger.info(f"Cleaning up {len(self.test_context.experiments_to_delete)} experiments")
-            for experiment_id, workspace in self.test_context.experiments_to_delete.items():
-                try:
-                    # Switch to the correct workspace
-                    if not self._switch_workspace(workspace, cleanup_errors):
-                        # Workspace switch failed, skip this resource
-                        continue
-
-                    # Check if experiment exists and is not already deleted
-                    experiment = self.admin_client.get_experiment(experiment_id)
-                    if experiment and experiment.lifecycle_stage != "deleted":
-                        self.admin_client.delete_experiment(experiment_id)
-                        logger.info(f"Deleted experiment {experiment_id} in workspace {workspace}")
-                    else:
-                        logger.debug(f"Experiment {experiment_id} already deleted or not found")
-                except Exception as e:
-                    # Log error but continue cleanup
-                    error_msg = f"Failed to delete experiment {experiment_id} in workspace {workspace}: {e}"
-                    logger.warning(error_msg)
-                    cleanup_errors.append(error_msg)
+            self._delete_per_workspace(self.test_context.experiments_to_delete, delete_experiment, cleanup_errors)
 
         # Cleanup runs with workspace awareness
+        def delete_run(run_id: str, workspace: str) -> str | None:
+            try:
+                # Deleting a run is idempotent, including runs of an experiment deleted above
+                self.admin_client.delete_run(run_id)
+                logger.info(f"Deleted run {run_id} in workspace {workspace}")
+            except Exception as e:
+                if isinstance(e, MlflowException) and e.error_code == "RESOURCE_DOES_NOT_EXIST":
+                    logger.debug(f"Run {run_id} already deleted or not found")
+                    return None
+                error_msg = f"Failed to delete run {run_id} in workspace {workspace}: {e}"
+                logger.warning(error_msg)
+                return error_msg
+            return None
+
         if self.test_context.runs_to_delete:
             logger.info(f"Cleaning up {len(self.test_context.runs_to_delete)} runs")
-            for run_id, workspace in self.test_context.runs_to_delete.items():
-                try:
-                    # Switch to the correct workspace
-                    if not self._switch_workspace(workspace, cleanup_errors):
-                        # Workspace switch failed, skip this resource
-                        continue
-
-                    # Check if run exists
-                    run = self.admin_client.get_run(run_id)
-                    if run and run.info.lifecycle_stage != "deleted":
-                        self.admin_client.delete_run(run_id)
-                        logger.info(f"Deleted run {run_id} in workspace {workspace}")
-                    else:
-                        logger.debug(f"Run {run_id} already deleted or not found")
-                except Exception as e:
-                    error_msg = f"Failed to delete run {run_id} in workspace {workspace}: {e}"
-                    logger.warning(error_msg)
-                    cleanup_errors.append(error_msg)
+            self._delete_per_workspace(self.test_context.runs_to_delete, delete_run, cleanup_errors)
 
         # Cleanup registered models with workspace awareness
+        def delete_registered_model(model_name: str, workspace: str) -> str | None:
+            try:
+                self.admin_client.delete_registered_model(model_name)
+                logger.info(f"Deleted registered model {model_name} in workspace {workspace}")
+            except Exception as delete_error:
+                # Model may not exist (already deleted or never created)
+                if "RESOURCE_DOES_NOT_EXIST" in str(delete_error) or "does not exist" in str(delete_error).lower():
+                    logger.debug(f"Registered model {model_name} already deleted or not found")
+                else:
+                    error_msg = f"Failed to delete registered model {model_name} in workspace {workspace}: {delete_error}"
+                    logger.warning(error_msg)
+                    return error_msg
+            return None
+
         if self.test_context.models_to_delete:
             logger.info(f"Cleaning up {len(self.test_context.models_to_delete)} registered models")
-            for model_name, workspace in self.test_context.models_to_delete.items():
-                try:
-                    # Switch to the correct workspace
-                    if not self._switch_workspace(workspace, cleanup_errors):
-                        # Workspace switch failed, skip this resource
-                        continue
-
-                    try:
-                        model = self.admin_client.get_registered_model(model_name)
-                        if model:
-                            self.admin_client.delete_registered_model(model_name)
-                            logger.info(f"Deleted registered model {model_name} in workspace {workspace}")
-                    except Exception as get_error:
-                        # Model may not exist (already deleted or never created)
-                        if "RESOURCE_DOES_NOT_EXIST" in str(get_error) or "does not exist" in str(get_error).lower():
-                            logger.debug(f"Registered model {model_name} already deleted or not found")
-                        else:
-                            error_msg = f"Failed to check registered model {model_name} in workspace {workspace}: {get_error}"
-                            logger.warning(error_msg)
-                            cleanup_errors.append(error_msg)
-                except Exception as e:
-                    error_msg = f"Failed to delete registered model {model_name} in workspace {workspace}: {e}"
-                    logger.warning(error_msg)
-                    cleanup_errors.append(error_msg)
+            self._delete_per_workspace(self.test_context.models_to_delete, delete_registered_model, cleanup_errors)
 
         # Cleanup users (users are global, no workspace switching needed)
+        def delete_user(user_info: UserInfo) -> str | None:
+            try:
+                # Pass workspace/namespace if available (needed for K8s, ignored for MLflow)
+                self.user_manager.delete_user(
+                    username=user_info.uname,
+                    namespace=user_info.workspace
+                )
+                logger.info(f"Deleted user: {user_info.uname}")
+            except Exception as e:
+                error_msg = f"Failed to delete user {user_info.uname}: {e}"
+                logger.warning(error_msg)
+                return error_msg
+            return None
+
         if self.test_context.users_to_delete:
-            logger.info(f"Cleaning up {len(self.test_context.users_to_delete)} users")
-            for user_info in self.test_context.users_to_delete:
-                try:
-                    # Attempt to delete user
-                    # Pass workspace/namespace if available (needed for K8s, ignored for MLflow)
-                    self.user_manager.delete_user(
-                        username=user_info.uname,
-                        namespace=user_info.workspace
-                    )
-                    logger.info(f"Deleted user: {user_info.uname}")
-                except Exception as e:
-                    error_msg = f"Failed to delete user {user_info.uname}: {e}"
-                    logger.warning(error_msg)
-                    cleanup_errors.append(error_msg)
+            users = self.test_context.users_to_delete
+            logger.info(f"Cleaning up {len(users)} users")
+            # Each user is an independent ServiceAccount/Role/RoleBinding set
+            with ThreadPoolExecutor(max_workers=min(_CLEANUP_MAX_WORKERS, len(users))) as executor:
+                errors = list(executor.map(delete_user, users))
+            cleanup_errors.extend(error for error in errors if error)
 
         # Cleanup Kubernetes resources created during the test
         if self.test_context.mlflowconfigs_to_delete or self.test_context.secrets_to_delete:
-            ClientManager.load_k8s_config()
+            api_client = ClientManager.get_k8s_api_client()
 
             if self.test_context.mlflowconfigs_to_delete:
                 logger.info(f"Cleaning up {len(self.test_context.mlflowconfigs_to_delete)} MLflowConfigs")
-                custom_api = k8s_client.CustomObjectsApi()
+                custom_api = k8s_client.CustomObjectsApi(api_client)
 
                 for name, namespace in self.test_context.mlflowconfigs_to_delete.items():
                     try:
@@ -310,7 +307,7 @@ class TestBase:
 
             if self.test_context.secrets_to_delete:
                 logger.info(f"Cleaning up {len(self.test_context.secrets_to_delete)} Secrets")
-                core_v1_api = k8s_client.CoreV1Api()
+                core_v1_api = k8s_client.CoreV1Api(api_client)
 
                 for name, namespace in self.test_context.secrets_to_delete.items():
                     try:
@@ -334,6 +331,17 @@ class TestBase:
                     logger.warning(error_msg)
                     cleanup_errors.append(error_msg)
 
+        # Cleanup local temporary files
+        for path in self.test_context.temp_paths_to_delete:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                error_msg = f"Failed to delete temporary file {path}: {e}"
+                logger.warning(error_msg)
+                cleanup_errors.append(error_msg)
+
         # Restore original workspace if it was set
         if original_workspace:
             try:
@@ -351,6 +359,36 @@ class TestBase:
         else:
             logger.info("Cleanup completed successfully")
 
+    def _delete_per_workspace(
+        self,
+        resources: dict[str, str],
+        delete_one: Callable[[str, str], str | None],
+        cleanup_errors: list[str],
+    ) -> None:
+        """Delete workspace-scoped MLflow resources, in parallel within each workspace.
+
+        Args:
+            resources: Mapping of resource identifier to its workspace
+            delete_one: Deletes one resource; returns an error message or None
+            cleanup_errors: List to append errors to
+
+        Note:
+            The workspace is switched once per group on the calling thread. Worker
+            threads start without MLflow's workspace ContextVar and fall back to the
+            MLFLOW_WORKSPACE environment variable that the switch also sets.
+        """
+        by_workspace: dict[str, list[str]] = {}
+        for resource_id, workspace in resources.items():
+            by_workspace.setdefault(workspace, []).append(resource_id)
+
+        for workspace, resource_ids in by_workspace.items():
+            if not self._switch_workspace(workspace, cleanup_errors):
+                # Workspace switch failed, skip these resources
+                continue
+            with ThreadPoolExecutor(max_workers=min(_CLEANUP_MAX_WORKERS, len(resource_ids))) as executor:
+                errors = list(executor.map(lambda resource_id: delete_one(resource_id, workspace), resource_ids))
+            cleanup_errors.extend(error for error in errors if error)
+
     def _switch_workspace(self, workspace: str, cleanup_errors: list[str]) -> bool:
         """Switch to a specified workspace with error handling.
 
@@ -429,29 +467,51 @@ class TestBase:
         )
         logger.debug(f"User will have {verb_names} verbs on {resource_type_names}")
 
-        # Create the user
-        user_info = self.user_manager.create_user(username=username, namespace=workspace)
-        logger.info(f"Created user '{username}' in workspace '{workspace}'")
-        logger.debug(f"User credentials: username={user_info[0]}, credential_length={len(user_info[1])}")
-
-        # Validate user token for K8s mode
-        token = user_info[1]
-        if not token or len(token) < 50:  # K8s tokens are typically much longer
-            logger.error(f"Invalid or short token for user '{username}': length={len(token) if token else 0}")
-            raise ValueError(f"User creation failed - token too short for K8s authentication")
-        logger.info(f"User '{username}' token validation passed")
-
-        # Create role and permissions
+        # The ServiceAccount/token and the Role/RoleBinding are independent round-trips:
+        # a RoleBinding and a SubjectAccessReview may name a ServiceAccount that does not
+        # exist yet. Provision both together so setup costs the slower of the two.
         logger.debug(f"Assigning {verb_names} verbs on {resource_type_names} to user '{username}'")
-        self.user_manager.create_role(
-            name=username,
-            workspace_name=workspace,
-            verbs=verbs if isinstance(verbs, list) else [verbs],
-            resources=resource_types,
-            subresources=subresources,
-            resource_names=resolved_resource_names,
-        )
-        logger.info(f"Assigned {verb_names} permissions on {resource_type_names} to user '{username}'")
+        executor = ThreadPoolExecutor(max_workers=2)
+        role_future = None
+        try:
+            user_future = executor.submit(self.user_manager.create_user, username=username, namespace=workspace)
+            role_future = executor.submit(
+                self.user_manager.create_role,
+                name=username,
+                workspace_name=workspace,
+                verbs=verbs if isinstance(verbs, list) else [verbs],
+                resources=resource_types,
+                subresources=subresources,
+                resource_names=resolved_resource_names,
+            )
+
+            # Create the user
+            user_info = user_future.result()
+            logger.info(f"Created user '{username}' in workspace '{workspace}'")
+            logger.debug(f"User credentials: username={user_info[0]}, credential_length={len(user_info[1])}")
+
+            # Validate user token for K8s mode
+            token = user_info[1]
+            if not token or len(token) < 50:  # K8s tokens are typically much longer
+                logger.error(f"Invalid or short token for user '{username}': length={len(token) if token else 0}")
+                raise ValueError(f"User creation failed - token too short for K8s authentication")
+            logger.info(f"User '{username}' token validation passed")
+
+            # Create role and permissions
+            role_future.result()
+            logger.info(f"Assigned {verb_names} permissions on {resource_type_names} to user '{username}'")
+        except BaseException:
+            # The user is not on the cleanup list yet. Rather than waiting out the role's
+            # SubjectAccessReview retries here, remove whatever was provisioned once the
+            # role apply settles, so its Role/RoleBinding cannot be re-created afterwards.
+            if role_future is not None:
+                role_future.cancel()
+                role_future.add_done_callback(lambda _: self._delete_partial_user(username, workspace))
+            else:
+                self._delete_partial_user(username, workspace)
+            raise
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Set authentication context and get authenticated client
         logger.debug(f"Setting authentication context for user '{username}'")
@@ -476,6 +536,19 @@ class TestBase:
 
         return user_info_obj
 
+    def _delete_partial_user(self, username: str, workspace: str) -> None:
+        """Delete the ServiceAccount and RBAC objects of a user whose setup failed.
+
+        Args:
+            username: ServiceAccount name of the user
+            workspace: Namespace the user was provisioned in
+        """
+        try:
+            self.user_manager.delete_user(username=username, namespace=workspace)
+            logger.info(f"Removed partially created user '{username}'")
+        except Exception as e:
+            logger.warning(f"Failed to remove partially created user '{username}': {e}")
+
     @pytest.fixture(scope="function", autouse=False)
     def create_user_with_permissions(self):
         """Create a test user with specific permissions in a workspace.
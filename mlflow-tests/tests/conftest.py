@@ -126,7 +126,8 @@ def pytest_collection_modifyitems(config, items):
 
 
 def pytest_sessionfinish(session, exitstatus):
-    """Treat missing post-upgrade datasets as a clean no-op instead of exit code 5."""
+    """Release the shared Kubernetes client and treat missing post-upgrade datasets as a clean no-op."""
+    ClientManager.close_k8s_client()
     phase = _get_requested_upgrade_phase(session.config.option.markexpr)
     if phase == "post_upgrade" and exitstatus == 5 and missing_post_upgrade_dataset():
         terminal_reporter = session.config.pluginmanager.getplugin("terminalreporter")
@@ -46,6 +46,7 @@ class TestContext:
         expected_artifact_path: Expected relative path within bucket for custom artifacts
         mlflowconfigs_to_delete: Map of mlflowconfig_name -> namespace for cleanup
         secrets_to_delete: Map of secret_name -> namespace for cleanup
+        temp_paths_to_delete: Local temporary files to remove during cleanup
     """
 
     workspaces: list[str] = field(default_factory=list)
@@ -82,6 +83,7 @@ class TestContext:
     discovered_workspaces: set[str] = field(default_factory=set)
     unlabeled_namespace: Optional[str] = None
     namespaces_to_delete: set[str] = field(default_factory=set)
+    temp_paths_to_delete: list[str] = field(default_factory=list)
     # Prevent pytest from collecting this dataclass as a test class because its
     # name starts with "Test".
     __test__ = False
@@ -220,3 +222,15 @@ class TestContext:
             raise ValueError("namespace name cannot be empty")
         self.namespaces_to_delete.add(name.strip())
 
+    def add_temp_path_for_cleanup(self, path: str) -> None:
+        """Add a local temporary file to the cleanup list.
+
+        Args:
+            path: Path of the temporary file
+
+        Raises:
+            ValueError: If path is empty
+        """
+        if not path or not path.strip():
+            raise ValueError("path cannot be empty")
+        self.temp_paths_to_delete.append(path)
@@ -0,0 +1,146 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import mlflow
+import pytest
+from kubernetes import client
+
+from mlflow_tests.utils.client import ClientManager, _K8S_RETRIES, _k8s_pool_maxsize
+
+
+@pytest.fixture(scope="module", autouse=True)
+def create_experiments_and_runs() -> dict:
+    """Override the integration bootstrap fixture for helper-level tests."""
+    return {}
+
+
+def test_create_k8s_client_shares_one_api_client() -> None:
+    ClientManager.close_k8s_client()
+    with patch.object(ClientManager, "load_k8s_config") as load_k8s_config:
+        core_v1_api, rbac_v1_api = ClientManager.create_k8s_client()
+        other_core_v1_api, _ = ClientManager.create_k8s_client()
+
+    try:
+        assert core_v1_api.api_client is rbac_v1_api.api_client
+        assert other_core_v1_api is core_v1_api
+        load_k8s_config.assert_called_once()
+    finally:
+        ClientManager.close_k8s_client()
+
+
+def test_create_mlflow_client_reuses_client_per_credential(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("MLFLOW_TRACKING_TOKEN", raising=False)
+    monkeypatch.setattr(mlflow, "set_tracking_uri", lambda uri: None)
+    ClientManager.clear_mlflow_client_cache()
+    uri = "http://mlflow.invalid"
+
+    first = ClientManager.create_mlflow_client(token="token-a", tracking_uri=uri)
+    again = ClientManager.create_mlflow_client(token="token-a", tracking_uri=uri)
+    other = ClientManager.create_mlflow_client(token="token-b", tracking_uri=uri)
+
+    try:
+        assert first is again
+        assert other is not first
+        assert os.environ["MLFLOW_TRACKING_TOKEN"] == "token-b"
+    finally:
+        ClientManager.clear_mlflow_client_cache()
+
+
+def test_create_mlflow_client_replaces_credentials_from_other_auth_modes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MLFLOW_TRACKING_USERNAME", "admin")
+    monkeypatch.setenv("MLFLOW_TRACKING_PASSWORD", "secret")
+    monkeypatch.delenv("MLFLOW_TRACKING_TOKEN", raising=False)
+    monkeypatch.setattr(mlflow, "set_tracking_uri", lambda uri: None)
+
+    try:
+        ClientManager.create_mlflow_client(token="token-a", tracking_uri="http://mlflow.invalid")
+
+        assert os.environ["MLFLOW_TRACKING_TOKEN"] == "token-a"
+        assert "MLFLOW_TRACKING_USERNAME" not in os.environ
+        assert "MLFLOW_TRACKING_PASSWORD" not in os.environ
+    finally:
+        ClientManager.clear_mlflow_client_cache()
+
+
+def test_create_mlflow_client_skips_unchanged_tracking_uri(monkeypatch: pytest.MonkeyPatch) -> None:
+    uri = "http://mlflow.invalid"
+    monkeypatch.delenv("MLFLOW_TRACKING_TOKEN", raising=False)
+    monkeypatch.setattr(mlflow, "get_tracking_uri", lambda: uri)
+    set_tracking_uri = Mock()
+    monkeypatch.setattr(mlflow, "set_tracking_uri", set_tracking_uri)
+
+    try:
+        ClientManager.create_mlflow_client(token="token-a", tracking_uri=uri)
+        ClientManager.create_mlflow_client(token="token-a", tracking_uri="http://other.invalid")
+    finally:
+        ClientManager.clear_mlflow_client_cache()
+
+    set_tracking_uri.assert_called_once_with("http://other.invalid")
+
+
+class _UnavailableHandler(BaseHTTPRequestHandler):
+    """Answer every request with 503 and count the requests received."""
+
+    requests_received = 0
+
+    def _reply(self) -> None:
+        type(self).requests_received += 1
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def unavailable_core_v1_api():
+    _UnavailableHandler.requests_received = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _UnavailableHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    configuration = client.Configuration()
+    configuration.host = f"http://127.0.0.1:{server.server_address[1]}"
+    configuration.retries = _K8S_RETRIES.new(backoff_factor=0)
+    api_client = client.ApiClient(configuration)
+    try:
+        yield client.CoreV1Api(api_client)
+    finally:
+        api_client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_k8s_retries_surface_api_exception_once_exhausted(unavailable_core_v1_api: client.CoreV1Api) -> None:
+    with pytest.raises(client.ApiException) as exc_info:
+        unavailable_core_v1_api.list_namespace()
+
+    assert exc_info.value.status == 503
+    assert _UnavailableHandler.requests_received == _K8S_RETRIES.total + 1
+
+
+def test_k8s_retries_do_not_repeat_posts(unavailable_core_v1_api: client.CoreV1Api) -> None:
+    body = client.V1ServiceAccount(metadata=client.V1ObjectMeta(name="sa"))
+
+    with pytest.raises(client.ApiException):
+        unavailable_core_v1_api.create_namespaced_service_account("ns", body)
+
+    assert _UnavailableHandler.requests_received == 1
+
+
+@pytest.mark.parametrize("value", ["", "abc", "0"])
+def test_k8s_pool_maxsize_falls_back_on_invalid_values(monkeypatch: pytest.MonkeyPatch, value: str) -> None:
+    monkeypatch.setenv("K8S_POOL_MAXSIZE", value)
+
+    assert _k8s_pool_maxsize() == 32
+
+
+def test_k8s_pool_maxsize_reads_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("K8S_POOL_MAXSIZE", "64")
+
+    assert _k8s_pool_maxsize() == 64
@@ -0,0 +1,162 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from mlflow_tests.enums import KubeVerb, ResourceType
+from mlflow_tests.manager.rbac import K8RoleManager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def create_experiments_and_runs() -> dict:
+    """Override the integration bootstrap fixture for helper-level tests."""
+    return {}
+
+
+def _sar_result(allowed: bool, reason: str | None = None, denied: bool | None = None) -> SimpleNamespace:
+    return SimpleNamespace(status=SimpleNamespace(allowed=allowed, reason=reason, denied=denied))
+
+
+@pytest.fixture
+def role_manager() -> K8RoleManager:
+    role_manager = K8RoleManager(Mock())
+    role_manager.auth_api = Mock()
+    return role_manager
+
+
+def test_verify_rbac_permissions_caches_granted_reviews(role_manager: K8RoleManager) -> None:
+    role_manager.auth_api.create_subject_access_review.return_value = _sar_result(True)
+
+    role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get")
+    role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get")
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 1
+
+
+def test_invalidate_sar_cache_forces_a_fresh_review(role_manager: K8RoleManager) -> None:
+    role_manager.auth_api.create_subject_access_review.return_value = _sar_result(True)
+
+    role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get")
+    role_manager.invalidate_sar_cache("sa", "ns")
+    role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get")
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 2
+
+
+def test_verify_rbac_permissions_does_not_cache_denials(role_manager: K8RoleManager) -> None:
+    role_manager.auth_api.create_subject_access_review.side_effect = [
+        _sar_result(False),
+        _sar_result(True),
+    ]
+
+    role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", retry_delay=0)
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 2
+
+
+def test_verify_rbac_permissions_stops_retrying_on_explicit_deny(role_manager: K8RoleManager) -> None:
+    role_manager.auth_api.create_subject_access_review.return_value = _sar_result(
+        False, reason="denied by policy", denied=True
+    )
+
+    with pytest.raises(RuntimeError, match="denied by policy"):
+        role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", retry_delay=0)
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 1
+
+
+def test_create_role_reuses_policy_rules_for_identical_grants(role_manager: K8RoleManager) -> None:
+    for name in ("user-a", "user-b"):
+        role_manager.create_role(name, "ns", [KubeVerb.GET], [ResourceType.EXPERIMENTS])
+
+    first, second = (c.kwargs["body"] for c in role_manager.rbac_v1_api.patch_namespaced_role.call_args_list)
+    assert first["metadata"]["name"] == "user-a"
+    assert second["metadata"]["name"] == "user-b"
+    assert all(a is b for a, b in zip(first["rules"], second["rules"]))
+
+
+def test_create_role_binding_uses_server_side_apply(role_manager: K8RoleManager) -> None:
+    role_manager.create_role_binding("user-binding", "ns", "user-role", "user")
+
+    call = role_manager.rbac_v1_api.patch_namespaced_role_binding.call_args
+    assert call.kwargs["_content_type"] == "application/apply-patch+yaml"
+    assert call.kwargs["force"] is True
+    assert call.kwargs["body"]["kind"] == "RoleBinding"
+    role_manager.rbac_v1_api.create_namespaced_role_binding.assert_not_called()
+
+
+def test_create_role_prefers_explicit_subresources(role_manager: K8RoleManager) -> None:
+    role_manager.create_role(
+        "user-role",
+        "ns",
+        [KubeVerb.CREATE],
+        [ResourceType.GATEWAY_SECRETS],
+        subresources=["gatewayendpoints/use"],
+    )
+
+    rules = role_manager.rbac_v1_api.patch_namespaced_role.call_args.kwargs["body"]["rules"]
+    assert any(rule["resources"] == ["gatewayendpoints/use"] for rule in rules)
+    assert not any(rule["resources"] == ["gatewaysecrets/use"] for rule in rules)
+
+
+def test_verify_rbac_permissions_fails_fast_after_review_api_errors(role_manager: K8RoleManager) -> None:
+    role_manager.auth_api.create_subject_access_review.side_effect = ConnectionError("unreachable")
+
+    with pytest.raises(RuntimeError, match="unreachable"):
+        role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", max_retries=2, retry_delay=0)
+    with pytest.raises(RuntimeError, match="SubjectAccessReview API is unavailable"):
+        role_manager.verify_rbac_permissions("other-sa", "ns", "experiments", "get", retry_delay=0)
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 2
+
+
+def test_sar_circuit_is_scoped_to_the_role_manager(role_manager: K8RoleManager) -> None:
+    role_manager.auth_api.create_subject_access_review.side_effect = ConnectionError("unreachable")
+    with pytest.raises(RuntimeError, match="unreachable"):
+        role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", max_retries=1, retry_delay=0)
+
+    other_manager = K8RoleManager(Mock())
+    other_manager.auth_api = Mock()
+    other_manager.auth_api.create_subject_access_review.return_value = _sar_result(True)
+
+    other_manager.verify_rbac_permissions("sa", "ns", "experiments", "get")
+
+
+def test_sar_circuit_probe_closes_circuit_once_api_responds(
+    role_manager: K8RoleManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(K8RoleManager, "SAR_CIRCUIT_OPEN_SECONDS", 0.0)
+    role_manager.auth_api.create_subject_access_review.side_effect = [
+        ConnectionError("unreachable"),
+        _sar_result(True),
+        _sar_result(True),
+    ]
+    with pytest.raises(RuntimeError, match="unreachable"):
+        role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", max_retries=1, retry_delay=0)
+
+    role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", retry_delay=0)
+    role_manager.verify_rbac_permissions("other-sa", "ns", "experiments", "get", retry_delay=0)
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 3
+
+
+def test_sar_circuit_probe_reopens_after_a_single_failed_attempt(
+    role_manager: K8RoleManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(K8RoleManager, "SAR_CIRCUIT_OPEN_SECONDS", 0.0)
+    role_manager.auth_api.create_subject_access_review.side_effect = ConnectionError("unreachable")
+    with pytest.raises(RuntimeError, match="unreachable"):
+        role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", max_retries=1, retry_delay=0)
+
+    with pytest.raises(RuntimeError, match="unreachable"):
+        role_manager.verify_rbac_permissions("sa", "ns", "experiments", "get", max_retries=5, retry_delay=0)
+
+    assert role_manager.auth_api.create_subject_access_review.call_count == 2
+
+
+def test_create_role_logs_rules_for_every_role(role_manager: K8RoleManager, caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level("DEBUG", logger="mlflow_tests.manager.rbac"):
+        for name in ("user-a", "user-b"):
+            role_manager.create_role(name, "ns", [KubeVerb.GET], [ResourceType.EXPERIMENTS])
+
+    assert any("Role 'user-b' rule" in message for message in caplog.messages)
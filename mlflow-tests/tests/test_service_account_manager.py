@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from mlflow_tests.manager.service_account import ServiceAccountManager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def create_experiments_and_runs() -> dict:
+    """Override the integration bootstrap fixture for helper-level tests."""
+    return {}
+
+
+def test_create_service_account_returns_created_object_without_reading() -> None:
+    sa_manager = ServiceAccountManager(Mock())
+
+    created = sa_manager._create_service_account("user", "ns")
+
+    assert created is sa_manager.core_v1_api.create_namespaced_service_account.return_value
+    sa_manager.core_v1_api.read_namespaced_service_account.assert_not_called()
+
+
+def test_token_request_retries_empty_responses() -> None:
+    sa_manager = ServiceAccountManager(Mock())
+    token = "header.payload.signature"
+    sa_manager.core_v1_api.create_namespaced_service_account_token.side_effect = [
+        SimpleNamespace(status=SimpleNamespace(token=None)),
+        SimpleNamespace(status=SimpleNamespace(token=token)),
+    ]
+
+    assert sa_manager._get_token_via_token_request("user", "ns", retry_delay=0) == token
+    assert sa_manager.core_v1_api.create_namespaced_service_account_token.call_count == 2
+
+
+def test_token_request_reuses_cached_token_until_service_account_deleted() -> None:
+    sa_manager = ServiceAccountManager(Mock())
+    sa_manager.core_v1_api.create_namespaced_service_account_token.return_value = SimpleNamespace(
+        status=SimpleNamespace(token="header.payload.signature")
+    )
+
+    sa_manager._get_token_via_token_request("user", "ns")
+    sa_manager._get_token_via_token_request("user", "ns")
+    sa_manager.delete_service_account("user", "ns")
+    sa_manager._get_token_via_token_request("user", "ns")
+
+    assert sa_manager.core_v1_api.create_namespaced_service_account_token.call_count == 2
@@ -0,0 +1,73 @@
+from unittest.mock import Mock
+
+import pytest
+
+from mlflow_tests.enums import KubeVerb, ResourceType
+from mlflow_tests.manager.user import K8UserManager
+
+
+@pytest.fixture(scope="module", autouse=True)
+def create_experiments_and_runs() -> dict:
+    """Override the integration bootstrap fixture for helper-level tests."""
+    return {}
+
+
+@pytest.fixture
+def user_manager() -> K8UserManager:
+    user_manager = K8UserManager(Mock(), Mock())
+    user_manager.role_manager = Mock()
+    return user_manager
+
+
+def test_create_role_verifies_every_resource_with_strongest_verb(user_manager: K8UserManager) -> None:
+    user_manager.create_role(
+        name="user",
+        workspace_name="ns",
+        verbs=[KubeVerb.GET, KubeVerb.DELETE],
+        resources=[ResourceType.EXPERIMENTS, ResourceType.REGISTERED_MODELS],
+        resource_names={ResourceType.EXPERIMENTS: ["exp-a"]},
+    )
+
+    calls = user_manager.role_manager.verify_rbac_permissions.call_args_list
+    checked = {(c.kwargs["resource"], c.kwargs["verb"], c.kwargs["resource_name"]) for c in calls}
+    assert checked == {
+        ("experiments", "delete", "exp-a"),
+        ("registeredmodels", "delete", None),
+    }
+
+
+def test_create_role_propagates_verification_failure(user_manager: K8UserManager) -> None:
+    user_manager.role_manager.verify_rbac_permissions.side_effect = RuntimeError("denied")
+
+    with pytest.raises(RuntimeError, match="denied"):
+        user_manager.create_role(
+            name="user",
+            workspace_name="ns",
+            verbs=[KubeVerb.GET],
+            resources=[ResourceType.EXPERIMENTS],
+        )
+
+
+def test_create_role_verifies_with_get_when_no_verbs_granted(user_manager: K8UserManager) -> None:
+    user_manager.create_role(
+        name="user",
+        workspace_name="ns",
+        verbs=[],
+        resources=[ResourceType.EXPERIMENTS],
+    )
+
+    assert user_manager.role_manager.verify_rbac_permissions.call_args.kwargs["verb"] == "get"
+
+
+def test_delete_user_removes_rbac_even_if_service_account_delete_fails(user_manager: K8UserManager) -> None:
+    user_manager.sa_manager = Mock()
+    user_manager.sa_manager.delete_service_account.side_effect = RuntimeError("sa boom")
+    user_manager.role_manager.rbac_v1_api.delete_namespaced_role.side_effect = RuntimeError("role boom")
+
+    with pytest.raises(RuntimeError, match="sa boom"):
+        user_manager.delete_user("user", "ns")
+
+    user_manager.role_manager.rbac_v1_api.delete_namespaced_role_binding.assert_called_once_with(
+        name="user-binding", namespace="ns"
+    )
+    user_manager.role_manager.invalidate_sar_cache.assert_called_once_with("user", "ns")